@@ -84,7 +84,11 @@ Respond with a JSON object:
 
         # Check expected content presence (deterministic)
         content_match_score = self._check_expected_content(
-            response, expected_content, expected_pattern, evidence
+            response,
+            expected_content,
+            expected_pattern,
+            evidence,
+            compiled_pattern=getattr(case, "compiled_output_pattern", None),
         )
 
         # Use LLM judge for deeper grounding analysis
@@ -139,8 +143,13 @@ Respond with a JSON object:
         expected_contains: list[str],
         expected_pattern: str | None,
         evidence: list[str],
+        compiled_pattern: re.Pattern[str] | None = None,
     ) -> float:
-        """Check if response contains expected content."""
+        """Check if response contains expected content.
+
+        ``compiled_pattern`` is a precompiled, case-insensitive form of
+        ``expected_pattern``; when given it is used instead of recompiling.
+        """
         if not expected_contains and not expected_pattern:
             return 0.8  # Neutral score if no expectations
 
@@ -162,7 +171,11 @@ Respond with a JSON object:
         if expected_pattern:
             total += 1
             try:
-                if re.search(expected_pattern, response, re.IGNORECASE):
+                if compiled_pattern is not None:
+                    matched = compiled_pattern.search(response)
+                else:
+                    matched = re.search(expected_pattern, response, re.IGNORECASE)
+                if matched:
                     matches += 1
                     evidence.append(f"Pattern matched: {expected_pattern}")
                 else:
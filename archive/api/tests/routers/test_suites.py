@@ -248,6 +248,45 @@ async def test_create_suite_success(
     assert data["agent_id"] == "test-agent"
 
 
+@pytest.mark.asyncio
+async def test_create_suite_accepts_json_only(
+    mock_api_key: ApiKey,
+    mock_eval_suite: EvalSuite,
+    sample_suite_data: dict[str, Any],
+) -> None:
+    """Test the real router takes a JSON body and rejects raw YAML with 422.
+
+    The CLI uploads suite files as validated JSON for this reason.
+    """
+    from src.auth.middleware import verify_api_key
+    from src.db.session import get_db
+
+    app = FastAPI()
+    app.include_router(suites.router, prefix="/api/v1")
+    app.dependency_overrides[verify_api_key] = lambda: mock_api_key
+    app.dependency_overrides[get_db] = lambda: None
+
+    mock_service = MagicMock()
+    mock_service.create_suite = AsyncMock(return_value=mock_eval_suite)
+
+    with patch("src.routers.suites.SuiteService", return_value=mock_service):
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            yaml_response = await client.post(
+                "/api/v1/suites",
+                content=b"name: test-suite\nagent_id: test-agent\n",
+                headers={"Content-Type": "application/yaml"},
+            )
+            json_response = await client.post("/api/v1/suites", json=sample_suite_data)
+
+    assert yaml_response.status_code == 422
+    assert json_response.status_code == 201
+    assert json_response.json()["name"] == "test-suite"
+    mock_service.create_suite.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_suite_success(
     mock_api_key: ApiKey,
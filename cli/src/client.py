@@ -1,11 +1,16 @@
 """API client for AgentEval."""
 
+import json
+from collections.abc import Iterator
 from typing import Any
 
 import httpx
 
 from src.config import get_config
 
+# Longest gap between event stream messages before the stream is abandoned
+STREAM_READ_TIMEOUT = 60.0
+
 
 class Client:
     """HTTP client for AgentEval API."""
@@ -29,17 +34,23 @@ class Client:
         path: str,
         json: dict | None = None,
         params: dict | None = None,
+        content: bytes | None = None,
+        content_type: str | None = None,
     ) -> dict[str, Any] | list[dict[str, Any]] | None:
         """Make an HTTP request."""
         url = f"{self.api_url}/api/v1{path}"
+        headers = self._headers()
+        if content_type:
+            headers["Content-Type"] = content_type
 
         with httpx.Client(timeout=self.timeout) as client:
             response = client.request(
                 method=method,
                 url=url,
-                headers=self._headers(),
+                headers=headers,
                 json=json,
                 params=params,
+                content=content,
             )
 
             if response.status_code == 204:
@@ -75,6 +86,13 @@ class Client:
         result = self._request("POST", "/suites", json=data)
         return result if isinstance(result, dict) else {}
 
+    def create_suite_json(self, payload: str) -> dict[str, Any]:
+        """Create a new suite from an already-serialized JSON payload."""
+        result = self._request(
+            "POST", "/suites", content=payload.encode(), content_type="application/json"
+        )
+        return result if isinstance(result, dict) else {}
+
     def delete_suite(self, suite_id: str) -> bool:
         """Delete a suite."""
         try:
@@ -123,6 +141,38 @@ class Client:
         result = self._request("GET", f"/runs/{run_id}/results", params=params)
         return result if isinstance(result, list) else []
 
+    def stream_run_events(self, run_id: str) -> Iterator[dict[str, Any]]:
+        """Stream status events for a run via Server-Sent Events.
+
+        Yields one decoded event per ``data:`` block until the server closes
+        the stream.
+
+        Raises:
+            httpx.HTTPStatusError: If the server rejects the stream request
+                (e.g. 404/405 on servers without the events endpoint)
+            httpx.TransportError: If the connection drops, or no data arrives
+                for STREAM_READ_TIMEOUT seconds
+            ValueError: If an event's data is not valid JSON
+        """
+        url = f"{self.api_url}/api/v1/runs/{run_id}/events"
+        headers = {**self._headers(), "Accept": "text/event-stream"}
+        timeout = httpx.Timeout(self.timeout, read=STREAM_READ_TIMEOUT)
+
+        with httpx.Client(timeout=timeout) as client:
+            with client.stream("GET", url, headers=headers) as response:
+                response.raise_for_status()
+
+                data_lines: list[str] = []
+                for line in response.iter_lines():
+                    if line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip())
+                    elif not line and data_lines:
+                        yield json.loads("\n".join(data_lines))
+                        data_lines = []
+
+                if data_lines:
+                    yield json.loads("\n".join(data_lines))
+
     def start_run(
         self,
         suite_id: str,
@@ -4,7 +4,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from src.client import get_client
 from src.config import get_config, save_config
 
 app = typer.Typer(help="Authentication management")
@@ -79,6 +78,8 @@ def manage_api_keys(
     key_id: str = typer.Option(None, "--id", help="Key ID (for revoke)"),
 ):
     """Manage API keys."""
+    from src.client import get_client
+
     client = get_client()
 
     if action == "list":
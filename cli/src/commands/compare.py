@@ -7,8 +7,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from src.client import get_client
-
 app = typer.Typer(help="Compare eval runs")
 console = Console()
 
@@ -71,7 +69,7 @@ def _compare_local_runs(
 
     # Resolve 'latest' to actual run ID
     if baseline == "latest":
-        runs = db.list_runs(limit=2)
+        runs = db.list_runs(limit=2, columns=("id",))
         if len(runs) < 2:
             console.print("[red]Not enough local runs to compare[/red]")
             raise typer.Exit(1)
@@ -111,6 +109,8 @@ def _compare_api_runs(
     output: str,
 ) -> None:
     """Compare API runs."""
+    from src.client import get_client
+
     client = get_client()
 
     # Resolve 'latest' to actual run ID
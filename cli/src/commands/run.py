@@ -2,19 +2,27 @@
 
 import subprocess
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.padding import Padding
 from rich.table import Table
 
-from src.client import get_client
-from src.loader import load_suite
+# The API client (httpx), suite loader (pydantic) and progress UI are imported
+# inside the commands that need them so list/show stay cheap to start.
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
+    from src.client import Client
 
 app = typer.Typer(help="Run evaluations")
 console = Console()
 
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
 
 @app.command("start")
 def start_run(
@@ -77,6 +85,8 @@ def _run_local(
     output: str,
 ) -> None:
     """Run evaluation locally without API server."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from src.local_runner import LocalRunner
 
     # Import agent loader - add api/src to path if needed
@@ -190,16 +200,20 @@ def _run_api(
     output: str,
 ) -> None:
     """Run evaluation via API server."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from src.client import get_client
+    from src.loader import load_suite_model
+
     client = get_client()
 
     # Determine if suite is a file or name
     suite_path = Path(suite)
     if suite_path.exists() and suite_path.suffix in (".yaml", ".yml"):
-        # Load from file and upload
+        # Validate locally and upload the model; the API only accepts JSON bodies
         console.print(f"[dim]Loading suite from {suite_path}...[/dim]")
-        suite_data = load_suite(suite_path)
-        # Create or update suite
-        result = client.create_suite(suite_data)
+        suite_model = load_suite_model(suite_path)
+        result = client.create_suite_json(suite_model.model_dump_json())
         suite_id = result["id"]
         suite_name = result["name"]
     else:
@@ -242,17 +256,7 @@ def _run_api(
         console=console,
     ) as progress:
         task = progress.add_task("Running evaluation...", total=None)
-
-        while True:
-            run_status = client.get_run(run_id)
-            status = run_status["status"]
-
-            if status in ("completed", "failed", "cancelled"):
-                break
-
-            import time
-
-            time.sleep(2)
+        run_status = _wait_for_run(client, run_id, progress, task)
 
     # Display results
     if output == "json":
@@ -267,6 +271,38 @@ def _run_api(
         _display_run_results(run_status)
 
 
+def _wait_for_run(
+    client: "Client", run_id: str, progress: "Progress", task: "TaskID"
+) -> dict:
+    """Wait for a run to reach a terminal status.
+
+    Subscribes to the server's run event stream and falls back to polling
+    when the server does not expose the events endpoint, or the stream
+    drops, stalls or sends an event that can't be decoded.
+    """
+    import httpx
+
+    try:
+        for event in client.stream_run_events(run_id):
+            status = event.get("status")
+            if status:
+                progress.update(task, description=f"Running evaluation ({status})...")
+            if status in TERMINAL_STATUSES:
+                return client.get_run(run_id)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code not in (404, 405):
+            raise
+    except (httpx.TransportError, ValueError):
+        pass
+
+    # Stream unavailable, broken or closed early - poll for completion
+    while True:
+        run_status = client.get_run(run_id)
+        if run_status["status"] in TERMINAL_STATUSES:
+            return run_status
+        time.sleep(2)
+
+
 @app.command("list")
 def list_runs(
     suite: str = typer.Option(None, "--suite", "-s", help="Filter by suite name"),
@@ -290,7 +326,12 @@ def _list_local_runs(
     from src.local_runner import LocalDatabase
 
     db = LocalDatabase()
-    runs = db.list_runs(suite_name=suite, status=status, limit=limit)
+    runs = db.list_runs(
+        suite_name=suite,
+        status=status,
+        limit=limit,
+        columns=("suite_name", "agent_version", "status", "summary", "created_at"),
+    )
 
     if not runs:
         console.print("[yellow]No local runs found[/yellow]")
@@ -334,6 +375,8 @@ def _list_api_runs(
     limit: int,
 ) -> None:
     """List runs from API server."""
+    from src.client import get_client
+
     client = get_client()
 
     suite_id = None
@@ -425,6 +468,8 @@ def _show_api_run(
     failed_only: bool,
 ) -> None:
     """Show API run details."""
+    from src.client import get_client
+
     client = get_client()
 
     with console.status(f"Fetching run {run_id}..."):
@@ -472,22 +517,18 @@ def _display_local_run_results(
 
     if results:
         console.print(f"\n[bold]Results:[/bold]")
+        grid = _results_grid()
         for result in results:
-            status_icon = "[green]\u2713[/green]" if result.passed else "[red]\u2717[/red]"
-            avg_score = (
-                sum(result.scores.values()) / len(result.scores)
-                if result.scores
-                else 0
-            )
-            console.print(
-                f"  {status_icon} {result.case_name}: "
-                f"[{'green' if result.passed else 'red'}]{avg_score:.2f}[/]"
-            )
+            color = "green" if result.passed else "red"
+            icon = "\u2713" if result.passed else "\u2717"
+            status_icon = f"[{color}]{icon}[/{color}]"
+            grid.add_row(status_icon, f"{result.case_name}:", f"[{color}]{result.avg_score:.2f}[/]")
 
             if show_details and result.score_details:
                 for scorer, detail in result.score_details.items():
                     if scorer != "trace_summary":
-                        console.print(f"      {scorer}: {detail.get('reason', 'N/A')}")
+                        grid.add_row("", f"    {scorer}: {detail.get('reason', 'N/A')}", "")
+        console.print(Padding.indent(grid, 2))
 
 
 def _display_run_results(run: dict, results: list | None = None, show_details: bool = False):
@@ -514,21 +555,31 @@ def _display_run_results(run: dict, results: list | None = None, show_details: b
 
     if results:
         console.print(f"\n[bold]Results:[/bold]")
+        grid = _results_grid()
         for result in results:
-            status_icon = "[green]\u2713[/green]" if result["passed"] else "[red]\u2717[/red]"
-            avg_score = (
-                sum(result["scores"].values()) / len(result["scores"])
-                if result["scores"]
-                else 0
-            )
-            console.print(
-                f"  {status_icon} {result['case_name']}: "
-                f"[{'green' if result['passed'] else 'red'}]{avg_score:.2f}[/]"
-            )
+            color = "green" if result["passed"] else "red"
+            icon = "\u2713" if result["passed"] else "\u2717"
+            status_icon = f"[{color}]{icon}[/{color}]"
+            avg_score = result.get("avg_score")
+            if avg_score is None:
+                # Older servers don't return a per-result average
+                scores = result["scores"]
+                avg_score = sum(scores.values()) / len(scores) if scores else 0
+            grid.add_row(status_icon, f"{result['case_name']}:", f"[{color}]{avg_score:.2f}[/]")
 
             if show_details and result.get("score_details"):
                 for scorer, detail in result["score_details"].items():
-                    console.print(f"      {scorer}: {detail.get('reason', 'N/A')}")
+                    grid.add_row("", f"    {scorer}: {detail.get('reason', 'N/A')}", "")
+        console.print(Padding.indent(grid, 2))
+
+
+def _results_grid() -> Table:
+    """Create the grid used to render per-case results in a single print."""
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(no_wrap=True)  # status icon
+    grid.add_column()  # case name / score details
+    grid.add_column(justify="right", no_wrap=True)  # average score
+    return grid
 
 
 def _get_git_sha() -> str | None:
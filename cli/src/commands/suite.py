@@ -6,9 +6,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from src.client import get_client
-from src.loader import load_suite, validate_suite
-
 app = typer.Typer(help="Manage eval suites")
 console = Console()
 
@@ -16,6 +13,8 @@ console = Console()
 @app.command("list")
 def list_suites():
     """List all eval suites."""
+    from src.client import get_client
+
     client = get_client()
 
     with console.status("Fetching suites..."):
@@ -45,6 +44,8 @@ def list_suites():
 @app.command("show")
 def show_suite(name: str = typer.Argument(..., help="Suite name")):
     """Show details of an eval suite."""
+    from src.client import get_client
+
     client = get_client()
 
     with console.status(f"Fetching suite '{name}'..."):
@@ -82,13 +83,16 @@ def create_suite(
         console.print(f"[red]File not found: {file}[/red]")
         raise typer.Exit(1)
 
+    from src.client import get_client
+    from src.loader import load_suite_model
+
     with console.status("Loading suite..."):
-        suite_data = load_suite(file)
+        suite_model = load_suite_model(file)
 
     client = get_client()
 
     with console.status("Creating suite..."):
-        result = client.create_suite(suite_data)
+        result = client.create_suite_json(suite_model.model_dump_json())
 
     console.print(f"[green]Created suite: {result['name']}[/green]")
     console.print(f"  ID: {result['id']}")
@@ -97,13 +101,31 @@ def create_suite(
 
 @app.command("validate")
 def validate_suite_file(
-    file: Path = typer.Argument(..., help="Path to YAML suite file"),
+    file: Path = typer.Argument(..., help="Path to YAML suite file or directory of suites"),
 ):
-    """Validate a suite YAML file."""
+    """Validate a suite YAML file, or every suite in a directory."""
     if not file.exists():
         console.print(f"[red]File not found: {file}[/red]")
         raise typer.Exit(1)
 
+    from src.loader import validate_suite, validate_suites_from_dir
+
+    if file.is_dir():
+        results = validate_suites_from_dir(file)
+        failed = {path: errors for path, errors in results.items() if errors}
+
+        for path, errors in failed.items():
+            console.print(f"[red]{path}: {len(errors)} error(s)[/red]")
+            for error in errors:
+                console.print(f"  - {error}")
+
+        if failed:
+            console.print(f"[red]{len(failed)} of {len(results)} suite file(s) invalid[/red]")
+            raise typer.Exit(1)
+
+        console.print(f"[green]All {len(results)} suite file(s) are valid: {file}[/green]")
+        return
+
     errors = validate_suite(file)
 
     if errors:
@@ -126,6 +148,8 @@ def delete_suite(
         if not confirm:
             raise typer.Abort()
 
+    from src.client import get_client
+
     client = get_client()
 
     with console.status(f"Deleting suite '{name}'..."):
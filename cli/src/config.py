@@ -1,5 +1,6 @@
 """CLI configuration management."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -7,8 +8,9 @@ from typing import Any
 import yaml
 
 
+@functools.cache
 def get_config_dir() -> Path:
-    """Get the config directory path."""
+    """Get the config directory path (resolved once per process)."""
     return Path.home() / ".agent-eval"
 
 
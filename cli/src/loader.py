@@ -1,10 +1,27 @@
 """YAML suite loader and validator."""
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+VALID_SCORERS: frozenset[str] = frozenset(
+    {"tool_selection", "reasoning", "grounding", "efficiency", "custom"}
+)
 
 
 class EvalCaseSchema(BaseModel):
@@ -23,6 +40,32 @@ class EvalCaseSchema(BaseModel):
     timeout_seconds: int = 300
     tags: list[str] = Field(default_factory=list)
 
+    _compiled_output_pattern: re.Pattern[str] | None = PrivateAttr(default=None)
+
+    @property
+    def compiled_output_pattern(self) -> re.Pattern[str] | None:
+        """Case-insensitive expected_output_pattern, compiled once at validation."""
+        return self._compiled_output_pattern
+
+    @field_validator("scorers")
+    @classmethod
+    def _check_scorers(cls, v: list[str]) -> list[str]:
+        unknown = [scorer for scorer in v if scorer not in VALID_SCORERS]
+        if unknown:
+            raise ValueError(f"unknown scorer(s): {', '.join(unknown)}")
+        return v
+
+    @model_validator(mode="after")
+    def _compile_output_pattern(self) -> "EvalCaseSchema":
+        if self.expected_output_pattern:
+            try:
+                self._compiled_output_pattern = re.compile(
+                    self.expected_output_pattern, re.IGNORECASE
+                )
+            except re.error as e:
+                raise ValueError(f"invalid expected_output_pattern: {e}") from e
+        return self
+
 
 class EvalSuiteSchema(BaseModel):
     """Schema for eval suite validation."""
@@ -38,28 +81,26 @@ class EvalSuiteSchema(BaseModel):
     cases: list[EvalCaseSchema] = Field(default_factory=list)
 
 
-def load_suite(path: Path) -> dict[str, Any]:
-    """Load eval suite from YAML file.
+def load_suite_model(path: Path) -> EvalSuiteSchema:
+    """Load and validate an eval suite from a YAML file.
 
     Args:
         path: Path to YAML file
 
     Returns:
-        Suite data as dictionary
+        Validated suite model
 
     Raises:
         ValueError: If file is invalid
     """
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(path.read_bytes(), Loader=_Loader)
 
     if not data:
         raise ValueError(f"Empty or invalid YAML file: {path}")
 
     # Validate against schema
     try:
-        suite = EvalSuiteSchema(**data)
-        return suite.model_dump()
+        return EvalSuiteSchema(**data)
     except ValidationError as e:
         errors = []
         for error in e.errors():
@@ -68,6 +109,25 @@ def load_suite(path: Path) -> dict[str, Any]:
         raise ValueError(f"Invalid suite file:\n" + "\n".join(errors))
 
 
+def load_suite_dict(path: Path) -> dict[str, Any]:
+    """Load eval suite from YAML file.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Suite data as dictionary
+
+    Raises:
+        ValueError: If file is invalid
+    """
+    return load_suite_model(path).model_dump()
+
+
+# Backward-compatible name for callers that expect a dict
+load_suite = load_suite_dict
+
+
 def validate_suite(path: Path) -> list[str]:
     """Validate a suite YAML file.
 
@@ -80,8 +140,7 @@ def validate_suite(path: Path) -> list[str]:
     errors = []
 
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(path.read_bytes(), Loader=_Loader)
     except yaml.YAMLError as e:
         return [f"YAML syntax error: {e}"]
 
@@ -96,26 +155,19 @@ def validate_suite(path: Path) -> list[str]:
             loc = ".".join(str(l) for l in error["loc"])
             errors.append(f"{loc}: {error['msg']}")
 
-    # Additional validations
-    if "cases" in data:
-        for i, case in enumerate(data["cases"]):
-            if "name" not in case:
-                errors.append(f"cases[{i}]: missing required field 'name'")
-            if "input" not in case:
-                errors.append(f"cases[{i}]: missing required field 'input'")
-
-            # Check for valid scorer names
-            valid_scorers = {"tool_selection", "reasoning", "grounding", "efficiency", "custom"}
-            if "scorers" in case:
-                for scorer in case["scorers"]:
-                    if scorer not in valid_scorers:
-                        errors.append(
-                            f"cases[{i}].scorers: unknown scorer '{scorer}'"
-                        )
-
     return errors
 
 
+def _suite_paths(dir_path: Path) -> list[Path]:
+    """List YAML suite files in a directory, sorted by name."""
+    with os.scandir(dir_path) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith((".yaml", ".yml")) and e.is_file()),
+            key=lambda e: e.name,
+        )
+    return [Path(e.path) for e in entries]
+
+
 def load_suites_from_dir(dir_path: Path) -> list[dict[str, Any]]:
     """Load all suites from a directory.
 
@@ -126,14 +178,28 @@ def load_suites_from_dir(dir_path: Path) -> list[dict[str, Any]]:
         List of suite data dictionaries
     """
     suites = []
-    for path in sorted(dir_path.glob("*.yaml")):
+    for path in _suite_paths(dir_path):
         try:
             suites.append(load_suite(path))
         except ValueError:
             continue  # Skip invalid files
-    for path in sorted(dir_path.glob("*.yml")):
-        try:
-            suites.append(load_suite(path))
-        except ValueError:
-            continue
     return suites
+
+
+def validate_suites_from_dir(dir_path: Path) -> dict[Path, list[str]]:
+    """Validate all suites in a directory in parallel.
+
+    Args:
+        dir_path: Path to directory containing YAML files
+
+    Returns:
+        Mapping of suite path to its validation errors (empty if valid)
+    """
+    paths = _suite_paths(dir_path)
+    if len(paths) <= 1:
+        return {path: validate_suite(path) for path in paths}
+
+    # Leave a couple of cores free for the rest of the system
+    max_workers = min(len(paths), max(1, (os.cpu_count() or 1) - 2))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(validate_suite, paths, chunksize=4)))
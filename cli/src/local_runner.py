@@ -5,30 +5,43 @@ Uses SQLite for result storage and connects to local MLflow.
 """
 
 import asyncio
+import functools
 import json
 import os
+import re
 import sys
+import threading
 import time
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+import warnings
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
-from uuid import uuid4
+from typing import Any, Callable, Literal, NamedTuple
+from uuid import UUID, uuid4
 
-# Add api/src to path to import scorers and mlflow client
+# Add api/src to path to import scorers and mlflow client. Skipped when the
+# directory doesn't exist (e.g. the API package is installed) so a dead entry
+# doesn't sit at the front of sys.path and get probed on every import.
 _api_src_path = str(Path(__file__).parent.parent.parent.parent / "api" / "src")
-if _api_src_path not in sys.path:
+if _api_src_path not in sys.path and os.path.isdir(_api_src_path):
     sys.path.insert(0, _api_src_path)
 
 # Import agent loader
 from agent import AgentLoadError, AgentProtocol, load_agent
 
 from src.config import get_config_dir
-from src.loader import EvalCaseSchema, EvalSuiteSchema, load_suite
+from src.loader import EvalCaseSchema, EvalSuiteSchema, load_suite_model
 
 
+@functools.lru_cache(maxsize=1)
 def _get_default_scorers():
-    """Lazy-load scorers to avoid import issues at module load time."""
+    """Lazy-load scorers to avoid import issues at module load time.
+
+    Cached so every runner in the process shares one set of scorer instances.
+    """
     from scorers import GroundingScorer, ReasoningScorer, ToolSelectionScorer
     return {
         "tool_selection": ToolSelectionScorer(),
@@ -47,11 +60,94 @@ except ImportError:
 try:
     import mlflow
     from mlflow import MlflowClient
+    from mlflow.entities import SpanType
 except ImportError:
     raise ImportError("mlflow is required for local mode. Install with: pip install mlflow>=3.7")
 
+# Optional fast JSON encoding for stored payloads; falls back to the stdlib
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Optional vectorized score comparison for large runs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many (case, scorer) pairs the plain loop beats building arrays
+_VECTORIZE_MIN_PAIRS = 1024
+
+# Optional compact binary encoding for large payload columns
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _decode_payload(value: str | bytes | None) -> Any:
+    """Decode a stored payload column.
 
-@dataclass
+    BLOB values were written in MessagePack, TEXT values in JSON, so rows
+    written with either storage format can be read back.
+    """
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        if msgpack is None:
+            raise ImportError(
+                "msgpack is required to read this database. Install with: pip install msgpack"
+            )
+        return msgpack.unpackb(value, raw=False, strict_map_key=False)
+    return _json_loads(value)
+
+
+# Column order of the runs table; list_runs projections are validated against it
+RUN_COLUMNS = (
+    "id",
+    "suite_id",
+    "suite_name",
+    "agent_version",
+    "trigger",
+    "status",
+    "config",
+    "summary",
+    "started_at",
+    "completed_at",
+    "created_at",
+)
+
+
+def _uuid4_batch(count: int) -> list[str]:
+    """Generate ``count`` random UUID4 strings from a single urandom read."""
+    raw = os.urandom(16 * count)
+    return [str(UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+
+
+# Finished runs kept in LocalDatabase's in-process cache. Only terminal
+# statuses are cached, since another process may still be writing a run
+# that is in progress.
+RUN_CACHE_SIZE = 128
+_CACHEABLE_RUN_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Results are written in batches of this size during sequential runs so
+# progress is persisted without paying a commit per case.
+RESULT_BATCH_SIZE = 16
+
+
+@dataclass(slots=True)
 class LocalCase:
     """Local representation of an eval case."""
 
@@ -68,9 +164,12 @@ class LocalCase:
     min_score: float
     timeout_seconds: int
     tags: list[str]
+    # expected_output_pattern compiled once at load time (case-insensitive,
+    # matching how scorers apply it)
+    compiled_output_pattern: re.Pattern[str] | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalSuite:
     """Local representation of an eval suite."""
 
@@ -82,7 +181,7 @@ class LocalSuite:
     cases: list[LocalCase]
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalResult:
     """Local representation of an eval result."""
 
@@ -100,9 +199,16 @@ class LocalResult:
     execution_time_ms: int
     error: str | None
     created_at: str
+    avg_score: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.avg_score is None:
+            self.avg_score = (
+                sum(self.scores.values()) / len(self.scores) if self.scores else 0.0
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalRun:
     """Local representation of an eval run."""
 
@@ -120,7 +226,7 @@ class LocalRun:
     results: list[LocalResult] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceSummary:
     """Summary statistics extracted from an MLflow trace."""
 
@@ -136,26 +242,214 @@ class TraceSummary:
     error: str | None = None
 
 
+# Statement text is kept in module constants so every call passes the same
+# SQL and hits the connection's prepared-statement cache.
+_INSERT_RUN_SQL = """
+    INSERT OR REPLACE INTO runs
+    (id, suite_id, suite_name, agent_version, trigger, status, config, summary,
+     started_at, completed_at, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_RESULT_SQL = """
+    INSERT OR REPLACE INTO results
+    (id, run_id, case_id, case_name, mlflow_run_id, mlflow_trace_id, status,
+     output, scores, score_details, passed, execution_time_ms, error, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SCORE_SQL = """
+    INSERT OR REPLACE INTO result_scores (run_id, result_id, scorer_id, score)
+    VALUES (?, ?, ?, ?)
+"""
+
+_INSERT_SCORER_SQL = "INSERT OR IGNORE INTO scorers (name) VALUES (?)"
+
+_SELECT_SCORERS_SQL = "SELECT id, name FROM scorers"
+
+_SUMMARIZE_RESULTS_SQL = """
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(passed), 0),
+        COALESCE(SUM(passed = 0 AND status = 'success'), 0),
+        COALESCE(SUM(status IN ('error', 'timeout')), 0),
+        COALESCE(SUM(execution_time_ms), 0)
+    FROM results WHERE run_id = ?
+"""
+
+_SUMMARIZE_SCORES_SQL = """
+    SELECT sc.name, SUM(rs.score), COUNT(*)
+    FROM result_scores rs JOIN scorers sc ON sc.id = rs.scorer_id
+    WHERE rs.run_id = ? GROUP BY rs.scorer_id
+"""
+
+RESULT_COLUMNS = (
+    "id",
+    "run_id",
+    "case_id",
+    "case_name",
+    "mlflow_run_id",
+    "mlflow_trace_id",
+    "status",
+    "output",
+    "scores",
+    "score_details",
+    "passed",
+    "execution_time_ms",
+    "error",
+    "created_at",
+)
+
+# Runs joined to their results in one statement. Result columns are prefixed
+# with "res_" since both tables have id/status/created_at.
+_SELECT_RUNS_WITH_RESULTS_SQL = (
+    "SELECT "
+    + ", ".join(f"r.{c}" for c in RUN_COLUMNS)
+    + ", "
+    + ", ".join(f"res.{c} AS res_{c}" for c in RESULT_COLUMNS)
+    + " FROM runs r LEFT JOIN results res ON res.run_id = r.id"
+    + " WHERE r.id IN ({placeholders}) ORDER BY res.rowid"
+)
+
+# SQLite caps bound parameters per statement; larger id lists are chunked
+_MAX_IN_PARAMS = 500
+
+_SELECT_RESULTS_SQL = "SELECT * FROM results WHERE run_id = ?"
+
+_SELECT_FAILED_RESULTS_SQL = _SELECT_RESULTS_SQL + " AND passed = 0"
+
+
+def _run_from_values(values: dict[str, Any]) -> LocalRun:
+    """Build a LocalRun from a mapping of stored runs columns."""
+    return LocalRun(
+        id=values["id"],
+        suite_id=values["suite_id"],
+        suite_name=values["suite_name"],
+        agent_version=values["agent_version"],
+        trigger=values["trigger"],
+        status=values["status"],
+        config=_decode_payload(values["config"]),
+        summary=_decode_payload(values["summary"]),
+        started_at=values["started_at"],
+        completed_at=values["completed_at"],
+        created_at=values["created_at"],
+    )
+
+
+def _copy_run(run: LocalRun) -> LocalRun:
+    """Copy a cached run so callers can modify it without changing the cache.
+
+    The results list, config and summary are copied; the LocalResult objects
+    in the list are shared.
+    """
+    return replace(
+        run,
+        config=dict(run.config) if run.config is not None else None,
+        summary=dict(run.summary) if run.summary is not None else None,
+        results=list(run.results),
+    )
+
+
+def _result_from_row(row: Any, prefix: str = "") -> LocalResult:
+    """Build a LocalResult from a results row, optionally with prefixed column names."""
+    return LocalResult(
+        id=row[f"{prefix}id"],
+        run_id=row[f"{prefix}run_id"],
+        case_id=row[f"{prefix}case_id"],
+        case_name=row[f"{prefix}case_name"],
+        mlflow_run_id=row[f"{prefix}mlflow_run_id"],
+        mlflow_trace_id=row[f"{prefix}mlflow_trace_id"],
+        status=row[f"{prefix}status"],
+        output=_decode_payload(row[f"{prefix}output"]),
+        scores=_json_loads(row[f"{prefix}scores"]),
+        score_details=_decode_payload(row[f"{prefix}score_details"]),
+        passed=bool(row[f"{prefix}passed"]),
+        execution_time_ms=row[f"{prefix}execution_time_ms"] or 0,
+        error=row[f"{prefix}error"],
+        created_at=row[f"{prefix}created_at"],
+    )
+
+
 class LocalDatabase:
     """SQLite database for local result storage."""
 
-    def __init__(self, db_path: Path | None = None):
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        storage_format: Literal["json", "msgpack"] = "json",
+    ):
         """Initialize local database.
 
         Args:
             db_path: Path to SQLite database. Defaults to ~/.agent-eval/results.db
+            storage_format: Encoding for the config, summary, output and
+                score_details columns. "msgpack" stores them as compact BLOBs; rows in either
+                format are always readable.
         """
+        if storage_format == "msgpack" and msgpack is None:
+            raise ImportError(
+                "msgpack is required for msgpack storage. Install with: pip install msgpack"
+            )
+        self.storage_format = storage_format
+
         if db_path is None:
             config_dir = get_config_dir()
             config_dir.mkdir(parents=True, exist_ok=True)
             db_path = config_dir / "results.db"
 
         self.db_path = db_path
+        # One connection shared by all methods (and the parallel case threads);
+        # the lock serializes access to it.
+        self._lock = threading.RLock()
+        self._run_cache: OrderedDict[str, LocalRun] = OrderedDict()
+        self._conn = self._connect()
         self._init_db()
 
+    def __enter__(self) -> "LocalDatabase":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _encode_payload(self, value: Any) -> str | bytes | None:
+        """Encode a payload column in the configured storage format."""
+        if not value:
+            return None
+        if self.storage_format == "msgpack":
+            return msgpack.packb(value, use_bin_type=True)
+        return _json_dumps(value)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection with write-friendly pragmas applied.
+
+        WAL is persistent in the database file; the remaining pragmas are
+        per-connection and are applied once here.
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+        """)
+        return conn
+
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS runs (
                     id TEXT PRIMARY KEY,
@@ -189,21 +483,63 @@ class LocalDatabase:
                     FOREIGN KEY (run_id) REFERENCES runs(id)
                 );
 
+                -- Scorer names are stored once and referenced by integer id
+                CREATE TABLE IF NOT EXISTS scorers (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE
+                );
+
+                -- One row per (result, scorer) so run summaries can be
+                -- aggregated in SQL without decoding each result's scores.
+                CREATE TABLE IF NOT EXISTS result_scores (
+                    run_id TEXT NOT NULL,
+                    result_id TEXT NOT NULL,
+                    scorer_id INTEGER NOT NULL REFERENCES scorers(id),
+                    score REAL NOT NULL,
+                    PRIMARY KEY (run_id, result_id, scorer_id)
+                ) WITHOUT ROWID;
+
                 CREATE INDEX IF NOT EXISTS idx_runs_suite ON runs(suite_id);
-                CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
-                CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+                -- list_runs filters on suite_name/status and pages by newest;
+                -- these let it walk an index in created_at order instead of sorting.
+                CREATE INDEX IF NOT EXISTS idx_runs_suite_status
+                    ON runs(suite_name, status, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_runs_status_created
+                    ON runs(status, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at DESC);
+                DROP INDEX IF EXISTS idx_runs_status;
+                -- (run_id, passed) serves both per-run reads and failed_only
+                -- filtering; it supersedes the older run_id-only index.
+                CREATE INDEX IF NOT EXISTS idx_results_run_passed ON results(run_id, passed);
+                DROP INDEX IF EXISTS idx_results_run;
             """)
 
+            self._scorer_ids = {
+                name: scorer_id for scorer_id, name in conn.execute(_SELECT_SCORERS_SQL)
+            }
+
+    def _scorer_id_map(self, names: set[str]) -> dict[str, int]:
+        """Return scorer ids for ``names``, registering unseen names.
+
+        Must be called with the lock held. Ids never change once assigned, so
+        they are cached for the life of the connection.
+        """
+        missing = names - self._scorer_ids.keys()
+        if missing:
+            conn = self._conn
+            conn.executemany(_INSERT_SCORER_SQL, [(name,) for name in missing])
+            self._scorer_ids.update(
+                (name, scorer_id) for scorer_id, name in conn.execute(_SELECT_SCORERS_SQL)
+            )
+        return self._scorer_ids
+
     def save_run(self, run: LocalRun) -> None:
         """Save a run to the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            self._run_cache.pop(run.id, None)
+            conn = self._conn
             conn.execute(
-                """
-                INSERT OR REPLACE INTO runs
-                (id, suite_id, suite_name, agent_version, trigger, status, config, summary,
-                 started_at, completed_at, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_RUN_SQL,
                 (
                     run.id,
                     run.suite_id,
@@ -211,8 +547,8 @@ class LocalDatabase:
                     run.agent_version,
                     run.trigger,
                     run.status,
-                    json.dumps(run.config) if run.config else None,
-                    json.dumps(run.summary) if run.summary else None,
+                    self._encode_payload(run.config),
+                    self._encode_payload(run.summary),
                     run.started_at,
                     run.completed_at,
                     run.created_at,
@@ -221,94 +557,175 @@ class LocalDatabase:
 
     def save_result(self, result: LocalResult) -> None:
         """Save a result to the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO results
-                (id, run_id, case_id, case_name, mlflow_run_id, mlflow_trace_id, status,
-                 output, scores, score_details, passed, execution_time_ms, error, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    result.id,
-                    result.run_id,
-                    result.case_id,
-                    result.case_name,
-                    result.mlflow_run_id,
-                    result.mlflow_trace_id,
-                    result.status,
-                    json.dumps(result.output) if result.output else None,
-                    json.dumps(result.scores),
-                    json.dumps(result.score_details) if result.score_details else None,
-                    1 if result.passed else 0,
-                    result.execution_time_ms,
-                    result.error,
-                    result.created_at,
-                ),
+        self.save_results_batch([result])
+
+    def save_results_batch(self, results: list[LocalResult]) -> None:
+        """Save several results in a single transaction."""
+        if not results:
+            return
+
+        params = [
+            (
+                result.id,
+                result.run_id,
+                result.case_id,
+                result.case_name,
+                result.mlflow_run_id,
+                result.mlflow_trace_id,
+                result.status,
+                self._encode_payload(result.output),
+                _json_dumps(result.scores),
+                self._encode_payload(result.score_details),
+                1 if result.passed else 0,
+                result.execution_time_ms,
+                result.error,
+                result.created_at,
             )
+            for result in results
+        ]
+
+        with self._lock:
+            for run_id in {result.run_id for result in results}:
+                self._run_cache.pop(run_id, None)
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(_INSERT_RESULT_SQL, params)
+                scorer_ids = self._scorer_id_map(
+                    {scorer for result in results for scorer in result.scores}
+                )
+                conn.executemany(
+                    _INSERT_SCORE_SQL,
+                    [
+                        (result.run_id, result.id, scorer_ids[scorer], score)
+                        for result in results
+                        for scorer, score in result.scores.items()
+                    ],
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                # Ids registered in this transaction were rolled back too
+                self._scorer_ids = {}
+                raise
+            conn.execute("COMMIT")
+
+    def summarize_run(self, run_id: str) -> dict[str, Any]:
+        """Aggregate a run's saved results into summary statistics.
+
+        Counts and per-scorer averages are computed by SQLite, so the
+        results themselves are never loaded or decoded.
+        """
+        with self._lock:
+            conn = self._conn
+            total, passed, failed, errored, total_time = conn.execute(
+                _SUMMARIZE_RESULTS_SQL, (run_id,)
+            ).fetchone()
+            score_rows = conn.execute(_SUMMARIZE_SCORES_SQL, (run_id,)).fetchall()
+
+        scores_by_type: dict[str, float] = {}
+        score_sum_all = 0.0
+        score_count = 0
+        for scorer, score_sum, count in score_rows:
+            scores_by_type[scorer] = round(score_sum / count, 4)
+            score_sum_all += score_sum
+            score_count += count
+        avg_score = score_sum_all / score_count if score_count else 0.0
+
+        return {
+            "total_cases": total,
+            "passed": passed,
+            "failed": failed,
+            "errored": errored,
+            "avg_score": round(avg_score, 4),
+            "scores_by_type": scores_by_type,
+            "execution_time_ms": total_time,
+        }
 
     def get_run(self, run_id: str) -> LocalRun | None:
         """Get a run by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM runs WHERE id = ?", (run_id,)
-            )
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            run = LocalRun(
-                id=row["id"],
-                suite_id=row["suite_id"],
-                suite_name=row["suite_name"],
-                agent_version=row["agent_version"],
-                trigger=row["trigger"],
-                status=row["status"],
-                config=json.loads(row["config"]) if row["config"] else None,
-                summary=json.loads(row["summary"]) if row["summary"] else None,
-                started_at=row["started_at"],
-                completed_at=row["completed_at"],
-                created_at=row["created_at"],
-            )
+        runs = self.get_runs_with_results([run_id])
+        return runs[0] if runs else None
 
-            # Load results
-            cursor = conn.execute(
-                "SELECT * FROM results WHERE run_id = ?", (run_id,)
-            )
-            for result_row in cursor:
-                run.results.append(
-                    LocalResult(
-                        id=result_row["id"],
-                        run_id=result_row["run_id"],
-                        case_id=result_row["case_id"],
-                        case_name=result_row["case_name"],
-                        mlflow_run_id=result_row["mlflow_run_id"],
-                        mlflow_trace_id=result_row["mlflow_trace_id"],
-                        status=result_row["status"],
-                        output=json.loads(result_row["output"]) if result_row["output"] else None,
-                        scores=json.loads(result_row["scores"]),
-                        score_details=json.loads(result_row["score_details"]) if result_row["score_details"] else None,
-                        passed=bool(result_row["passed"]),
-                        execution_time_ms=result_row["execution_time_ms"] or 0,
-                        error=result_row["error"],
-                        created_at=result_row["created_at"],
-                    )
-                )
+    def get_runs_with_results(self, run_ids: list[str]) -> list[LocalRun]:
+        """Get several runs and their results with one joined query per chunk.
+
+        Args:
+            run_ids: IDs of the runs to load.
+
+        Finished runs are kept in a small LRU cache, so repeated lookups (e.g.
+        one baseline compared against many candidates) skip the query. Each
+        call returns its own copy of a cached run, but the LocalResult objects
+        in its results are shared and should be treated as read-only.
 
-            return run
+        Returns:
+            Runs found, in the order their IDs were given, each with results
+            attached. Unknown IDs are skipped.
+        """
+        runs: dict[str, LocalRun] = {}
+        with self._lock:
+            conn = self._conn
+            missing = []
+            for run_id in dict.fromkeys(run_ids):
+                cached = self._run_cache.get(run_id)
+                if cached is not None:
+                    self._run_cache.move_to_end(run_id)
+                    runs[run_id] = _copy_run(cached)
+                else:
+                    missing.append(run_id)
+
+            for start in range(0, len(missing), _MAX_IN_PARAMS):
+                chunk = missing[start : start + _MAX_IN_PARAMS]
+                query = _SELECT_RUNS_WITH_RESULTS_SQL.format(
+                    placeholders=", ".join("?" * len(chunk))
+                )
+                for row in conn.execute(query, chunk):
+                    run = runs.get(row["id"])
+                    if run is None:
+                        run = runs[row["id"]] = _run_from_values(row)
+                    if row["res_id"] is not None:
+                        run.results.append(_result_from_row(row, prefix="res_"))
+
+            for run_id in missing:
+                run = runs.get(run_id)
+                if run is not None and run.status in _CACHEABLE_RUN_STATUSES:
+                    self._run_cache[run_id] = _copy_run(run)
+                    if len(self._run_cache) > RUN_CACHE_SIZE:
+                        self._run_cache.popitem(last=False)
+
+        return [runs[run_id] for run_id in dict.fromkeys(run_ids) if run_id in runs]
 
     def list_runs(
         self,
         suite_name: str | None = None,
         status: str | None = None,
         limit: int = 50,
+        offset: int = 0,
+        columns: tuple[str, ...] | None = None,
     ) -> list[LocalRun]:
-        """List runs with optional filters."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        """List runs with optional filters.
 
-            query = "SELECT * FROM runs WHERE 1=1"
+        Args:
+            suite_name: Only return runs of this suite.
+            status: Only return runs with this status.
+            limit: Maximum number of runs to return.
+            offset: Number of runs to skip, for paging through history.
+            columns: Run columns to load. Omitted columns are left as None,
+                which avoids decoding config/summary blobs a caller won't use.
+                Defaults to all columns.
+        """
+        if columns is None:
+            columns = RUN_COLUMNS
+        else:
+            unknown = set(columns) - set(RUN_COLUMNS)
+            if unknown:
+                raise ValueError(f"Unknown run column(s): {', '.join(sorted(unknown))}")
+            if "id" not in columns:
+                columns = ("id", *columns)
+
+        with self._lock:
+            conn = self._conn
+
+            query = f"SELECT {', '.join(columns)} FROM runs WHERE 1=1"
             params: list[Any] = []
 
             if suite_name:
@@ -318,79 +735,49 @@ class LocalDatabase:
                 query += " AND status = ?"
                 params.append(status)
 
-            query += " ORDER BY created_at DESC LIMIT ?"
-            params.append(limit)
+            query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+            params.extend((limit, offset))
 
-            cursor = conn.execute(query, params)
             runs = []
-            for row in cursor:
-                runs.append(
-                    LocalRun(
-                        id=row["id"],
-                        suite_id=row["suite_id"],
-                        suite_name=row["suite_name"],
-                        agent_version=row["agent_version"],
-                        trigger=row["trigger"],
-                        status=row["status"],
-                        config=json.loads(row["config"]) if row["config"] else None,
-                        summary=json.loads(row["summary"]) if row["summary"] else None,
-                        started_at=row["started_at"],
-                        completed_at=row["completed_at"],
-                        created_at=row["created_at"],
-                    )
-                )
+            for row in conn.execute(query, params):
+                values = dict.fromkeys(RUN_COLUMNS)
+                values.update(zip(columns, row))
+                runs.append(_run_from_values(values))
             return runs
 
     def get_results_for_run(
         self, run_id: str, failed_only: bool = False
     ) -> list[LocalResult]:
         """Get results for a run."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            query = "SELECT * FROM results WHERE run_id = ?"
-            params: list[Any] = [run_id]
-
-            if failed_only:
-                query += " AND passed = 0"
-
-            cursor = conn.execute(query, params)
-            results = []
-            for row in cursor:
-                results.append(
-                    LocalResult(
-                        id=row["id"],
-                        run_id=row["run_id"],
-                        case_id=row["case_id"],
-                        case_name=row["case_name"],
-                        mlflow_run_id=row["mlflow_run_id"],
-                        mlflow_trace_id=row["mlflow_trace_id"],
-                        status=row["status"],
-                        output=json.loads(row["output"]) if row["output"] else None,
-                        scores=json.loads(row["scores"]),
-                        score_details=json.loads(row["score_details"]) if row["score_details"] else None,
-                        passed=bool(row["passed"]),
-                        execution_time_ms=row["execution_time_ms"] or 0,
-                        error=row["error"],
-                        created_at=row["created_at"],
-                    )
-                )
-            return results
+        query = _SELECT_FAILED_RESULTS_SQL if failed_only else _SELECT_RESULTS_SQL
+        with self._lock:
+            conn = self._conn
+            return [_result_from_row(row) for row in conn.execute(query, (run_id,))]
 
 
 class LocalMLflowClient:
     """MLflow client for local execution mode."""
 
-    def __init__(self, tracking_uri: str | None = None):
+    def __init__(self, tracking_uri: str | None = None, tracing_enabled: bool | None = None):
         """Initialize MLflow client for local mode.
 
         Args:
             tracking_uri: MLflow tracking URI. Defaults to MLFLOW_TRACKING_URI env var
                          or http://localhost:5000.
+            tracing_enabled: Whether to record MLflow runs and traces. Defaults to
+                             on unless NEON_LOCAL_DISABLE_TRACING is set. When off,
+                             agents are only timed and no MLflow server is contacted.
         """
         self._tracking_uri = tracking_uri or os.environ.get(
             "MLFLOW_TRACKING_URI", "http://localhost:5000"
         )
+        if tracing_enabled is None:
+            tracing_enabled = os.environ.get("NEON_LOCAL_DISABLE_TRACING", "").lower() not in (
+                "1",
+                "true",
+                "yes",
+            )
+        self.tracing_enabled = tracing_enabled
         mlflow.set_tracking_uri(self._tracking_uri)
         self._client = MlflowClient(self._tracking_uri)
         self._current_experiment_id: str | None = None
@@ -400,8 +787,11 @@ class LocalMLflowClient:
         """Get the MLflow tracking URI."""
         return self._tracking_uri
 
-    def set_experiment(self, name: str) -> str:
-        """Set or create an experiment."""
+    def set_experiment(self, name: str) -> str | None:
+        """Set or create an experiment. Returns None when tracing is disabled."""
+        if not self.tracing_enabled:
+            return None
+
         if not name.startswith("neon-local-"):
             name = f"neon-local-{name}"
 
@@ -423,6 +813,9 @@ class LocalMLflowClient:
             Dict with mlflow_run_id, mlflow_trace_id, output, status, error,
             execution_time_ms, and trace_summary.
         """
+        if not self.tracing_enabled:
+            return self._execute_untraced(agent_fn, input_data)
+
         neon_tags = {"neon.source": "neon-local"}
         if tags:
             neon_tags.update({
@@ -476,32 +869,64 @@ class LocalMLflowClient:
                 "trace_summary": trace_summary,
             }
 
+    def _execute_untraced(
+        self, agent_fn: Callable[..., Any], input_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Execute an agent function without MLflow, timing it only."""
+        status = "success"
+        error = None
+        output = None
+
+        start_time = time.perf_counter()
+        try:
+            output = agent_fn(**input_data)
+        except Exception as e:
+            status = "error"
+            error = str(e)
+        execution_time_ms = int((time.perf_counter() - start_time) * 1000)
+
+        return {
+            "mlflow_run_id": None,
+            "mlflow_trace_id": None,
+            "output": output,
+            "status": status,
+            "error": error,
+            "execution_time_ms": execution_time_ms,
+            "trace_summary": None,
+        }
+
     def _extract_trace_summary(self, trace: Any) -> dict[str, Any] | None:
         """Extract summary from MLflow trace."""
         try:
-            from mlflow.entities import SpanType
-
-            spans = list(trace.data.spans) if trace.data else []
-            tool_spans = [s for s in spans if s.span_type == SpanType.TOOL]
-            llm_spans = [s for s in spans if s.span_type == SpanType.CHAT_MODEL]
+            spans = trace.data.spans if trace.data else []
 
+            # Classify spans and aggregate token counts in one pass
+            total_spans = 0
+            tool_calls: list[str] = []
+            llm_calls = 0
             total_tokens = 0
             input_tokens = 0
             output_tokens = 0
 
-            for span in llm_spans:
-                attrs = span.attributes or {}
-                total_tokens += attrs.get("llm.token_count.total", 0)
-                input_tokens += attrs.get("llm.token_count.prompt", 0)
-                output_tokens += attrs.get("llm.token_count.completion", 0)
+            for span in spans:
+                total_spans += 1
+                span_type = span.span_type
+                if span_type == SpanType.TOOL:
+                    tool_calls.append(span.name)
+                elif span_type == SpanType.CHAT_MODEL:
+                    llm_calls += 1
+                    attrs = span.attributes or {}
+                    total_tokens += attrs.get("llm.token_count.total", 0)
+                    input_tokens += attrs.get("llm.token_count.prompt", 0)
+                    output_tokens += attrs.get("llm.token_count.completion", 0)
 
             status = trace.info.status if trace.info else "UNKNOWN"
 
             return {
                 "trace_id": trace.info.request_id,
-                "total_spans": len(spans),
-                "tool_calls": [s.name for s in tool_spans],
-                "llm_calls": len(llm_spans),
+                "total_spans": total_spans,
+                "tool_calls": tool_calls,
+                "llm_calls": llm_calls,
                 "total_tokens": total_tokens,
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
@@ -513,62 +938,30 @@ class LocalMLflowClient:
 
 
 class CaseModelAdapter:
-    """Adapter to make LocalCase work with scorers that expect EvalCaseModel."""
+    """Adapter to make LocalCase work with scorers that expect EvalCaseModel.
 
-    def __init__(self, case: LocalCase):
-        self._case = case
-
-    @property
-    def id(self) -> str:
-        return self._case.id
-
-    @property
-    def name(self) -> str:
-        return self._case.name
-
-    @property
-    def description(self) -> str | None:
-        return self._case.description
-
-    @property
-    def input(self) -> dict[str, Any]:
-        return self._case.input
-
-    @property
-    def expected_tools(self) -> list[str] | None:
-        return self._case.expected_tools
-
-    @property
-    def expected_tool_sequence(self) -> list[str] | None:
-        return self._case.expected_tool_sequence
+    LocalCase already has the EvalCaseModel field names, so attribute reads
+    are forwarded to the wrapped case. The runner passes LocalCase to scorers
+    directly; this wrapper is kept for callers that construct it explicitly.
+    """
 
-    @property
-    def expected_output_contains(self) -> list[str] | None:
-        return self._case.expected_output_contains
+    __slots__ = ("_case",)
 
-    @property
-    def expected_output_pattern(self) -> str | None:
-        return self._case.expected_output_pattern
+    def __init__(self, case: LocalCase):
+        self._case = case
 
-    @property
-    def scorers(self) -> list[str]:
-        return self._case.scorers
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._case, name)
 
-    @property
-    def scorer_config(self) -> dict[str, Any] | None:
-        return self._case.scorer_config
 
-    @property
-    def min_score(self) -> float:
-        return self._case.min_score
-
-    @property
-    def timeout_seconds(self) -> int:
-        return self._case.timeout_seconds
+class _CaseInFlight(NamedTuple):
+    """A case whose agent call has finished and whose scoring may be pending."""
 
-    @property
-    def tags(self) -> list[str]:
-        return self._case.tags
+    case: LocalCase
+    exec_result: dict[str, Any] | None
+    future: Future[list[tuple[str, Any]]] | None
+    deadline: float
+    error: Exception | None
 
 
 class LocalRunner:
@@ -579,6 +972,7 @@ class LocalRunner:
         db: LocalDatabase | None = None,
         mlflow_client: LocalMLflowClient | None = None,
         scorers: dict[str, Any] | None = None,
+        max_workers: int | None = None,
     ):
         """Initialize the local runner.
 
@@ -586,16 +980,24 @@ class LocalRunner:
             db: Local database for storing results. Defaults to ~/.agent-eval/results.db
             mlflow_client: MLflow client for tracing. Defaults to local MLflow instance.
             scorers: Optional scorer dictionary. Defaults to built-in scorers.
+            max_workers: Maximum cases in flight during parallel runs.
+                Defaults to min(32, number of cases).
         """
         self.db = db or LocalDatabase()
         self.mlflow_client = mlflow_client or LocalMLflowClient()
         self._scorers = scorers
+        self.max_workers = max_workers
+        self._scorer_loop: asyncio.AbstractEventLoop | None = None
+        self._scorer_loop_lock = threading.Lock()
+        # Scorers used by the current run, resolved once in execute_run
+        self._resolved_scorers: dict[str, Any] | None = None
 
     @property
     def scorers(self) -> dict[str, Any]:
         """Get the scorers, lazy-loading defaults if needed."""
         if self._scorers is None:
-            self._scorers = _get_default_scorers()
+            # Copy so per-runner changes don't leak into the shared cache
+            self._scorers = dict(_get_default_scorers())
         return self._scorers
 
     @scorers.setter
@@ -603,6 +1005,29 @@ class LocalRunner:
         """Set the scorers."""
         self._scorers = value
 
+    def _get_scorer_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop that runs scorer coroutines.
+
+        Used by sequential runs; the loop is started on first use and shared
+        by every case for the lifetime of the runner. Parallel runs score on
+        their own event loop instead.
+        """
+        with self._scorer_loop_lock:
+            if self._scorer_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="local-runner-scorers", daemon=True
+                ).start()
+                self._scorer_loop = loop
+            return self._scorer_loop
+
+    def close(self) -> None:
+        """Stop the background scorer loop, if it was started."""
+        with self._scorer_loop_lock:
+            if self._scorer_loop is not None:
+                self._scorer_loop.call_soon_threadsafe(self._scorer_loop.stop)
+                self._scorer_loop = None
+
     def load_suite_from_file(self, suite_path: Path) -> LocalSuite:
         """Load an eval suite from a YAML file.
 
@@ -612,42 +1037,65 @@ class LocalRunner:
         Returns:
             LocalSuite object.
         """
-        suite_data = load_suite(suite_path)
-
-        cases = []
-        for case_data in suite_data.get("cases", []):
-            cases.append(
-                LocalCase(
-                    id=str(uuid4()),
-                    name=case_data["name"],
-                    description=case_data.get("description"),
-                    input=case_data["input"],
-                    expected_tools=case_data.get("expected_tools"),
-                    expected_tool_sequence=case_data.get("expected_tool_sequence"),
-                    expected_output_contains=case_data.get("expected_output_contains"),
-                    expected_output_pattern=case_data.get("expected_output_pattern"),
-                    scorers=case_data.get("scorers", suite_data.get("default_scorers", ["tool_selection", "reasoning"])),
-                    scorer_config=case_data.get("scorer_config"),
-                    min_score=case_data.get("min_score", suite_data.get("default_min_score", 0.7)),
-                    timeout_seconds=case_data.get("timeout_seconds", suite_data.get("default_timeout_seconds", 300)),
-                    tags=case_data.get("tags", []),
-                )
+        suite_model = load_suite_model(suite_path)
+
+        # The schema compiles each case's expected_output_pattern while validating
+        cases = [
+            LocalCase(
+                id=case_id,
+                name=case.name,
+                description=case.description,
+                input=case.input,
+                expected_tools=case.expected_tools,
+                expected_tool_sequence=case.expected_tool_sequence,
+                expected_output_contains=case.expected_output_contains,
+                expected_output_pattern=case.expected_output_pattern,
+                scorers=case.scorers,
+                scorer_config=case.scorer_config,
+                min_score=case.min_score,
+                timeout_seconds=case.timeout_seconds,
+                tags=case.tags,
+                compiled_output_pattern=case.compiled_output_pattern,
             )
+            for case_id, case in zip(_uuid4_batch(len(suite_model.cases)), suite_model.cases)
+        ]
 
         config = {
-            "parallel": suite_data.get("parallel", True),
-            "stop_on_failure": suite_data.get("stop_on_failure", False),
+            "parallel": suite_model.parallel,
+            "stop_on_failure": suite_model.stop_on_failure,
         }
 
         return LocalSuite(
             id=str(uuid4()),
-            name=suite_data["name"],
-            description=suite_data.get("description"),
-            agent_id=suite_data.get("agent_id", ""),
+            name=suite_model.name,
+            description=suite_model.description,
+            agent_id=suite_model.agent_id,
             config=config,
             cases=cases,
         )
 
+    def _resolve_scorers(self, suite: LocalSuite) -> dict[str, Any]:
+        """Look up every scorer the suite's cases use, once per run.
+
+        Unknown scorer names are reported with a warning, since cases that
+        use them would otherwise be scored on the remaining scorers only.
+        """
+        available = self.scorers
+        resolved: dict[str, Any] = {}
+        unknown: set[str] = set()
+        for case in suite.cases:
+            for name in case.scorers:
+                if name in available:
+                    resolved[name] = available[name]
+                else:
+                    unknown.add(name)
+        if unknown:
+            warnings.warn(
+                f"Suite '{suite.name}' uses unknown scorer(s): {', '.join(sorted(unknown))}",
+                stacklevel=3,
+            )
+        return resolved
+
     def execute_run(
         self,
         suite: LocalSuite,
@@ -667,6 +1115,7 @@ class LocalRunner:
             LocalRun with results.
         """
         # Create run record
+        started = _now_iso()
         run = LocalRun(
             id=str(uuid4()),
             suite_id=suite.id,
@@ -676,9 +1125,9 @@ class LocalRunner:
             status="running",
             config=suite.config,
             summary=None,
-            started_at=datetime.utcnow().isoformat(),
+            started_at=started,
             completed_at=None,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=started,
         )
 
         # Set up MLflow experiment
@@ -687,34 +1136,44 @@ class LocalRunner:
         # Save initial run state
         self.db.save_run(run)
 
+        self._resolved_scorers = self._resolve_scorers(suite)
         try:
             # Determine execution mode
             use_parallel = parallel if parallel is not None else suite.config.get("parallel", True)
             stop_on_failure = suite.config.get("stop_on_failure", False)
 
-            # Execute cases
+            # Execute cases, writing results in batched transactions
             if use_parallel:
                 # Run async for parallel execution
                 results = asyncio.run(self._execute_cases_parallel(run, suite, agent))
+                self.db.save_results_batch(results)
             else:
                 results = []
-                for case in suite.cases:
-                    result = self._execute_case(run, case, suite, agent)
+                saved = 0
+                for result in self._execute_cases_sequential(
+                    run, suite, agent, overlap_scoring=not stop_on_failure
+                ):
                     results.append(result)
+                    if len(results) - saved >= RESULT_BATCH_SIZE:
+                        self.db.save_results_batch(results[saved:])
+                        saved = len(results)
                     if stop_on_failure and not result.passed:
                         break
+                self.db.save_results_batch(results[saved:])
 
             run.results = results
 
             # Calculate summary
-            run.summary = self._calculate_summary(results)
+            run.summary = self.db.summarize_run(run.id)
             run.status = "completed"
-            run.completed_at = datetime.utcnow().isoformat()
+            run.completed_at = _now_iso()
 
         except Exception as e:
             run.status = "failed"
-            run.completed_at = datetime.utcnow().isoformat()
+            run.completed_at = _now_iso()
             run.summary = {"error": str(e)}
+        finally:
+            self._resolved_scorers = None
 
         # Save final run state
         self.db.save_run(run)
@@ -726,17 +1185,51 @@ class LocalRunner:
         suite: LocalSuite,
         agent: AgentProtocol | Callable[..., Any],
     ) -> list[LocalResult]:
-        """Execute cases in parallel using asyncio."""
-        loop = asyncio.get_event_loop()
+        """Execute cases concurrently with a bounded async pipeline.
+
+        At most ``max_workers`` cases are in flight at once. Only the blocking
+        agent/MLflow call runs on a worker thread; scoring runs on the loop.
+        """
+        max_workers = self.max_workers or min(32, len(suite.cases)) or 1
+        semaphore = asyncio.Semaphore(max_workers)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="local-runner-case"
+        ) as executor:
+
+            async def run_case(case: LocalCase) -> LocalResult:
+                async with semaphore:
+                    return await self._execute_case_async(run, case, suite, agent, executor)
+
+            return await asyncio.gather(*(run_case(case) for case in suite.cases))
+
+    async def _execute_case_async(
+        self,
+        run: LocalRun,
+        case: LocalCase,
+        suite: LocalSuite,
+        agent: AgentProtocol | Callable[..., Any],
+        executor: ThreadPoolExecutor,
+    ) -> LocalResult:
+        """Async counterpart of ``_execute_case`` used by parallel runs."""
+        exec_result: dict[str, Any] | None = None
+        scored: list[tuple[str, Any]] = []
+        error: Exception | None = None
 
-        async def run_case(case: LocalCase) -> LocalResult:
-            # Run in thread pool to avoid blocking
-            return await loop.run_in_executor(
-                None, self._execute_case, run, case, suite, agent
+        try:
+            loop = asyncio.get_running_loop()
+            exec_result = await loop.run_in_executor(
+                executor, self._trace_case, run, case, suite, agent
             )
+            if exec_result["status"] == "success" and exec_result["output"] is not None:
+                scored = await asyncio.wait_for(
+                    self._score_case(case, exec_result["output"]),
+                    timeout=case.timeout_seconds,
+                )
+        except Exception as e:
+            error = e
 
-        tasks = [run_case(case) for case in suite.cases]
-        return await asyncio.gather(*tasks)
+        return self._build_result(run, case, exec_result, scored, error)
 
     def _execute_case(
         self,
@@ -754,95 +1247,198 @@ class LocalRunner:
             agent: The agent to test.
 
         Returns:
-            LocalResult with execution results.
+            LocalResult with execution results. The caller is responsible
+            for saving it.
+        """
+        return self._finish_case(run, self._start_case(run, case, suite, agent))
+
+    def _execute_cases_sequential(
+        self,
+        run: LocalRun,
+        suite: LocalSuite,
+        agent: AgentProtocol | Callable[..., Any],
+        overlap_scoring: bool,
+    ) -> Iterator[LocalResult]:
+        """Yield results for a suite's cases, running the agent one case at a time.
+
+        With ``overlap_scoring``, a case's scorers run on the scorer loop while
+        the agent executes the next case, so slow (e.g. LLM-judged) scoring
+        overlaps agent I/O. Agent calls stay strictly sequential either way.
+        Without it, each case is fully scored before the next starts, which
+        stop_on_failure needs.
+        """
+        if not overlap_scoring:
+            for case in suite.cases:
+                yield self._execute_case(run, case, suite, agent)
+            return
+
+        pending: _CaseInFlight | None = None
+        for case in suite.cases:
+            started = self._start_case(run, case, suite, agent)
+            if pending is not None:
+                yield self._finish_case(run, pending)
+            pending = started
+        if pending is not None:
+            yield self._finish_case(run, pending)
+
+    def _start_case(
+        self,
+        run: LocalRun,
+        case: LocalCase,
+        suite: LocalSuite,
+        agent: AgentProtocol | Callable[..., Any],
+    ) -> _CaseInFlight:
+        """Run the agent for a case and submit its scoring to the scorer loop."""
+        exec_result: dict[str, Any] | None = None
+        future: Future[list[tuple[str, Any]]] | None = None
+        error: Exception | None = None
+
+        try:
+            exec_result = self._trace_case(run, case, suite, agent)
+            if exec_result["status"] == "success" and exec_result["output"] is not None:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._score_case(case, exec_result["output"]),
+                    self._get_scorer_loop(),
+                )
+        except Exception as e:
+            error = e
+
+        return _CaseInFlight(
+            case, exec_result, future, time.monotonic() + case.timeout_seconds, error
+        )
+
+    def _finish_case(self, run: LocalRun, in_flight: _CaseInFlight) -> LocalResult:
+        """Wait for a started case's scoring (within its timeout) and build its result."""
+        case, exec_result, future, deadline, error = in_flight
+        scored: list[tuple[str, Any]] = []
+
+        if future is not None:
+            try:
+                scored = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except TimeoutError as e:
+                future.cancel()
+                error = e
+            except Exception as e:
+                error = e
+
+        return self._build_result(run, case, exec_result, scored, error)
+
+    def _trace_case(
+        self,
+        run: LocalRun,
+        case: LocalCase,
+        suite: LocalSuite,
+        agent: AgentProtocol | Callable[..., Any],
+    ) -> dict[str, Any]:
+        """Run the agent on a case under MLflow tracing (blocking)."""
+        query = case.input.get("query", "")
+        context = case.input.get("context", {})
+
+        # Create wrapper function for agent execution
+        def agent_callable(query: str, context: dict[str, Any] | None = None) -> Any:
+            if hasattr(agent, "run"):
+                return agent.run(query, context)
+            return agent(query, context)
+
+        run_name = f"{run.id[:8]}/{case.name}"
+        tags = {
+            "run_id": run.id,
+            "case_name": case.name,
+            "suite_name": suite.name,
+        }
+        if run.agent_version:
+            tags["agent_version"] = run.agent_version
+
+        return self.mlflow_client.execute_with_tracing(
+            agent_fn=agent_callable,
+            input_data={"query": query, "context": context},
+            run_name=run_name,
+            tags=tags,
+            timeout_seconds=case.timeout_seconds,
+        )
+
+    async def _score_case(self, case: LocalCase, output: Any) -> list[tuple[str, Any]]:
+        """Run a case's scorers concurrently.
+
+        Returns:
+            (scorer name, scorer result) pairs in the case's scorer order.
         """
+        scorers = self._resolved_scorers
+        if scorers is None:
+            scorers = self.scorers
+        resolved = [
+            (scorer_name, scorer)
+            for scorer_name in case.scorers
+            if (scorer := scorers.get(scorer_name))
+        ]
+        if not resolved:
+            return []
+
+        # LocalCase exposes the EvalCaseModel fields scorers read
+        scorer_results = await asyncio.gather(
+            *(
+                scorer.score(case=case, output=output, config=case.scorer_config)
+                for _, scorer in resolved
+            )
+        )
+        return [
+            (scorer_name, scorer_result)
+            for (scorer_name, _), scorer_result in zip(resolved, scorer_results)
+        ]
+
+    def _build_result(
+        self,
+        run: LocalRun,
+        case: LocalCase,
+        exec_result: dict[str, Any] | None,
+        scored: list[tuple[str, Any]],
+        error: Exception | None,
+    ) -> LocalResult:
+        """Assemble a LocalResult from a case's execution and scoring outcome."""
         status = "success"
         output: dict[str, Any] | None = None
-        error: str | None = None
+        error_message: str | None = None
         scores: dict[str, float] = {}
         score_details: dict[str, Any] = {}
         mlflow_run_id: str | None = None
         mlflow_trace_id: str | None = None
         execution_time_ms: int = 0
 
-        try:
-            # Build agent callable
-            query = case.input.get("query", "")
-            context = case.input.get("context", {})
-
-            # Create wrapper function for agent execution
-            def agent_callable(query: str, context: dict[str, Any] | None = None) -> Any:
-                if hasattr(agent, "run"):
-                    return agent.run(query, context)
-                return agent(query, context)
-
-            # Execute agent with MLflow tracing
-            run_name = f"{run.id[:8]}/{case.name}"
-            tags = {
-                "run_id": run.id,
-                "case_name": case.name,
-                "suite_name": suite.name,
-            }
-            if run.agent_version:
-                tags["agent_version"] = run.agent_version
-
-            exec_result = self.mlflow_client.execute_with_tracing(
-                agent_fn=agent_callable,
-                input_data={"query": query, "context": context},
-                run_name=run_name,
-                tags=tags,
-                timeout_seconds=case.timeout_seconds,
-            )
-
-            # Extract results
+        if exec_result is not None:
             mlflow_run_id = exec_result["mlflow_run_id"]
             mlflow_trace_id = exec_result["mlflow_trace_id"]
             execution_time_ms = exec_result["execution_time_ms"]
 
             if exec_result["status"] == "success":
                 output = exec_result["output"]
-                status = "success"
             else:
                 status = "error"
-                error = exec_result["error"]
+                error_message = exec_result["error"]
 
             # Add trace summary to score_details
             if exec_result.get("trace_summary"):
                 score_details["trace_summary"] = exec_result["trace_summary"]
 
-            # Run scorers if execution was successful
-            if status == "success" and output is not None:
-                case_adapter = CaseModelAdapter(case)
-                for scorer_name in case.scorers:
-                    scorer = self.scorers.get(scorer_name)
-                    if scorer:
-                        scorer_result = asyncio.run(
-                            scorer.score(
-                                case=case_adapter,
-                                output=output,
-                                config=case.scorer_config,
-                            )
-                        )
-                        scores[scorer_name] = scorer_result.score
-                        score_details[scorer_name] = {
-                            "score": scorer_result.score,
-                            "reason": scorer_result.reason,
-                            "evidence": scorer_result.evidence,
-                        }
-
-        except TimeoutError:
+        for scorer_name, scorer_result in scored:
+            scores[scorer_name] = scorer_result.score
+            score_details[scorer_name] = {
+                "score": scorer_result.score,
+                "reason": scorer_result.reason,
+                "evidence": scorer_result.evidence,
+            }
+
+        if isinstance(error, TimeoutError):
             status = "timeout"
-            error = f"Execution timed out after {case.timeout_seconds}s"
-        except Exception as e:
+            error_message = f"Execution timed out after {case.timeout_seconds}s"
+        elif error is not None:
             status = "error"
-            error = str(e)
+            error_message = str(error)
 
         # Calculate pass/fail
         avg_score = sum(scores.values()) / len(scores) if scores else 0.0
         passed = avg_score >= case.min_score and status == "success"
 
-        # Create result
-        result = LocalResult(
+        return LocalResult(
             id=str(uuid4()),
             run_id=run.id,
             case_id=case.id,
@@ -855,53 +1451,69 @@ class LocalRunner:
             score_details=score_details,
             passed=passed,
             execution_time_ms=execution_time_ms,
-            error=error,
-            created_at=datetime.utcnow().isoformat(),
+            error=error_message,
+            created_at=_now_iso(),
+            avg_score=avg_score,
         )
 
-        # Save result
-        self.db.save_result(result)
-        return result
-
-    def _calculate_summary(self, results: list[LocalResult]) -> dict[str, Any]:
-        """Calculate summary statistics for a run."""
-        total = len(results)
-        passed = sum(1 for r in results if r.passed)
-        failed = sum(1 for r in results if not r.passed and r.status == "success")
-        errored = sum(1 for r in results if r.status in ("error", "timeout"))
-
-        # Calculate average scores
-        all_scores: dict[str, list[float]] = {}
-        for result in results:
-            for scorer, score in result.scores.items():
-                if scorer not in all_scores:
-                    all_scores[scorer] = []
-                all_scores[scorer].append(score)
-
-        scores_by_type = {
-            scorer: sum(scores) / len(scores)
-            for scorer, scores in all_scores.items()
-        }
 
-        avg_score = (
-            sum(sum(scores) for scores in all_scores.values())
-            / sum(len(scores) for scores in all_scores.values())
-            if all_scores
-            else 0.0
-        )
+def _classify_score_deltas(
+    pairs: list[tuple[str, str, float, float]], threshold: float
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
+    """Split score pairs into regressions, improvements and an unchanged count.
 
-        total_time = sum(r.execution_time_ms or 0 for r in results)
+    Deltas are computed with NumPy when it is installed and the comparison is
+    large enough to amortize building the arrays.
+    """
 
+    def entry(i: int, delta: float) -> dict[str, Any]:
+        case_name, scorer, baseline_score, candidate_score = pairs[i]
         return {
-            "total_cases": total,
-            "passed": passed,
-            "failed": failed,
-            "errored": errored,
-            "avg_score": round(avg_score, 4),
-            "scores_by_type": {k: round(v, 4) for k, v in scores_by_type.items()},
-            "execution_time_ms": total_time,
+            "case_name": case_name,
+            "scorer": scorer,
+            "baseline_score": baseline_score,
+            "candidate_score": candidate_score,
+            "delta": delta,
         }
 
+    neg_threshold = -threshold
+
+    if np is not None and len(pairs) >= _VECTORIZE_MIN_PAIRS:
+        baseline = np.fromiter((p[2] for p in pairs), dtype=np.float64, count=len(pairs))
+        candidate = np.fromiter((p[3] for p in pairs), dtype=np.float64, count=len(pairs))
+        deltas = candidate - baseline
+        regressed = np.flatnonzero(deltas < neg_threshold)
+        improved = np.flatnonzero(deltas > threshold)
+        return (
+            [entry(i, float(deltas[i])) for i in regressed],
+            [entry(i, float(deltas[i])) for i in improved],
+            len(pairs) - len(regressed) - len(improved),
+        )
+
+    regressions: list[dict[str, Any]] = []
+    improvements: list[dict[str, Any]] = []
+    # Bound once; the loop body then only touches locals
+    regressions_append = regressions.append
+    improvements_append = improvements.append
+    unchanged = 0
+    for case_name, scorer, baseline_score, candidate_score in pairs:
+        delta = candidate_score - baseline_score
+        if delta < neg_threshold:
+            append = regressions_append
+        elif delta > threshold:
+            append = improvements_append
+        else:
+            unchanged += 1
+            continue
+        append({
+            "case_name": case_name,
+            "scorer": scorer,
+            "baseline_score": baseline_score,
+            "candidate_score": candidate_score,
+            "delta": delta,
+        })
+    return regressions, improvements, unchanged
+
 
 def compare_local_runs(
     baseline_id: str,
@@ -922,53 +1534,27 @@ def compare_local_runs(
     """
     db = db or LocalDatabase()
 
-    baseline = db.get_run(baseline_id)
-    candidate = db.get_run(candidate_id)
+    # Both runs and their results in one query (or from the run cache)
+    runs = {run.id: run for run in db.get_runs_with_results([baseline_id, candidate_id])}
+    baseline = runs.get(baseline_id)
+    candidate = runs.get(candidate_id)
 
     if not baseline:
         raise ValueError(f"Baseline run not found: {baseline_id}")
     if not candidate:
         raise ValueError(f"Candidate run not found: {candidate_id}")
 
-    baseline_results = db.get_results_for_run(baseline_id)
-    candidate_results = db.get_results_for_run(candidate_id)
-
-    # Build lookup by case name
-    baseline_by_case = {r.case_name: r for r in baseline_results}
-    candidate_by_case = {r.case_name: r for r in candidate_results}
-
-    regressions = []
-    improvements = []
-    unchanged = 0
-
-    # Compare matching cases
-    for case_name in set(baseline_by_case.keys()) & set(candidate_by_case.keys()):
-        baseline_result = baseline_by_case[case_name]
-        candidate_result = candidate_by_case[case_name]
-
-        for scorer in set(baseline_result.scores.keys()) & set(candidate_result.scores.keys()):
-            baseline_score = baseline_result.scores[scorer]
-            candidate_score = candidate_result.scores[scorer]
-            delta = candidate_score - baseline_score
-
-            if delta < -threshold:
-                regressions.append({
-                    "case_name": case_name,
-                    "scorer": scorer,
-                    "baseline_score": baseline_score,
-                    "candidate_score": candidate_score,
-                    "delta": delta,
-                })
-            elif delta > threshold:
-                improvements.append({
-                    "case_name": case_name,
-                    "scorer": scorer,
-                    "baseline_score": baseline_score,
-                    "candidate_score": candidate_score,
-                    "delta": delta,
-                })
-            else:
-                unchanged += 1
+    baseline_by_case = {r.case_name: r for r in baseline.results}
+    candidate_by_case = {r.case_name: r for r in candidate.results}
+
+    # (case, scorer, baseline score, candidate score) for every shared score
+    pairs = [
+        (case_name, scorer, baseline_score, candidate_score)
+        for case_name in baseline_by_case.keys() & candidate_by_case.keys()
+        for scorer, baseline_score in baseline_by_case[case_name].scores.items()
+        if (candidate_score := candidate_by_case[case_name].scores.get(scorer)) is not None
+    ]
+    regressions, improvements, unchanged = _classify_score_deltas(pairs, threshold)
 
     # Calculate overall delta
     baseline_avg = baseline.summary.get("avg_score", 0) if baseline.summary else 0
@@ -0,0 +1,146 @@
+"""Tests for suite loader module."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the cli/src to path
+cli_src_path = str(Path(__file__).parent.parent / "src")
+if cli_src_path not in sys.path:
+    sys.path.insert(0, cli_src_path)
+
+
+def _write_suite(path: Path, name: str) -> None:
+    path.write_text(
+        f"""
+name: {name}
+agent_id: test-agent
+cases:
+  - name: case_1
+    input:
+      query: "What is 2+2?"
+"""
+    )
+
+
+class TestLoadSuitesFromDir:
+    """Tests for load_suites_from_dir."""
+
+    def test_loads_yaml_and_yml_in_name_order(self, tmp_path):
+        """Test .yaml and .yml files are loaded in a single sorted pass."""
+        from loader import load_suites_from_dir
+
+        _write_suite(tmp_path / "b.yaml", "suite-b")
+        _write_suite(tmp_path / "a.yml", "suite-a")
+        _write_suite(tmp_path / "c.yaml", "suite-c")
+        (tmp_path / "notes.txt").write_text("not a suite")
+
+        suites = load_suites_from_dir(tmp_path)
+
+        assert [s["name"] for s in suites] == ["suite-a", "suite-b", "suite-c"]
+
+    def test_skips_invalid_files(self, tmp_path):
+        """Test invalid suite files are skipped."""
+        from loader import load_suites_from_dir
+
+        _write_suite(tmp_path / "good.yaml", "good")
+        (tmp_path / "bad.yaml").write_text("name: missing-agent-id\n")
+        (tmp_path / "dir.yaml").mkdir()
+
+        suites = load_suites_from_dir(tmp_path)
+
+        assert [s["name"] for s in suites] == ["good"]
+
+
+class TestValidateSuite:
+    """Tests for validate_suite."""
+
+    def test_unknown_scorer_reported_with_location(self, tmp_path):
+        """Test unknown scorer names are rejected by the case schema."""
+        from loader import validate_suite
+
+        suite_path = tmp_path / "suite.yaml"
+        suite_path.write_text(
+            """
+name: test-suite
+agent_id: test-agent
+cases:
+  - name: case_1
+    input:
+      query: "What is 2+2?"
+    scorers:
+      - reasoning
+      - vibes
+"""
+        )
+
+        errors = validate_suite(suite_path)
+
+        assert len(errors) == 1
+        assert errors[0].startswith("cases.0.scorers:")
+        assert "vibes" in errors[0]
+
+    def test_missing_required_fields(self, tmp_path):
+        """Test missing case fields are reported once each."""
+        from loader import validate_suite
+
+        suite_path = tmp_path / "suite.yaml"
+        suite_path.write_text(
+            """
+name: test-suite
+agent_id: test-agent
+cases:
+  - description: no name or input
+"""
+        )
+
+        errors = validate_suite(suite_path)
+
+        assert sorted(e.split(":")[0] for e in errors) == ["cases.0.input", "cases.0.name"]
+
+
+class TestEvalCaseSchema:
+    """Tests for EvalCaseSchema."""
+
+    def test_output_pattern_compiled_once(self):
+        """Test expected_output_pattern is compiled case-insensitively during validation."""
+        from loader import EvalCaseSchema
+
+        case = EvalCaseSchema(
+            name="case_1",
+            input={"query": "refund"},
+            expected_output_pattern=r"refund.*processed",
+        )
+
+        assert case.compiled_output_pattern is not None
+        assert case.compiled_output_pattern.search("Refund was PROCESSED")
+        assert case.model_dump()["expected_output_pattern"] == r"refund.*processed"
+
+    def test_invalid_output_pattern_rejected(self):
+        """Test an invalid regex fails schema validation."""
+        from pydantic import ValidationError
+
+        from loader import EvalCaseSchema
+
+        with pytest.raises(ValidationError, match="invalid expected_output_pattern"):
+            EvalCaseSchema(name="case_1", input={}, expected_output_pattern="(unclosed")
+
+
+class TestValidateSuitesFromDir:
+    """Tests for validate_suites_from_dir."""
+
+    def test_reports_errors_per_file(self, tmp_path):
+        """Test every suite file is validated and errors are keyed by path."""
+        from loader import validate_suites_from_dir
+
+        _write_suite(tmp_path / "a.yaml", "suite-a")
+        _write_suite(tmp_path / "b.yml", "suite-b")
+        (tmp_path / "c.yaml").write_text("name: missing-agent-id\n")
+
+        results = validate_suites_from_dir(tmp_path)
+
+        assert list(results) == [tmp_path / "a.yaml", tmp_path / "b.yml", tmp_path / "c.yaml"]
+        assert results[tmp_path / "a.yaml"] == []
+        assert results[tmp_path / "b.yml"] == []
+        assert results[tmp_path / "c.yaml"] == ["agent_id: Field required"]
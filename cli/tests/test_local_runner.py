@@ -41,6 +41,18 @@ class TestLocalDatabase:
         assert "runs" in tables
         assert "results" in tables
 
+    def test_init_enables_wal(self, tmp_path):
+        """Test database is switched to WAL journal mode."""
+        from local_runner import LocalDatabase
+
+        db_path = tmp_path / "test.db"
+        LocalDatabase(db_path)
+
+        with sqlite3.connect(db_path) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
     def test_save_and_get_run(self, tmp_path):
         """Test saving and retrieving a run."""
         from local_runner import LocalDatabase, LocalRun
@@ -120,6 +132,205 @@ class TestLocalDatabase:
         assert results[0].case_name == "test_case_1"
         assert results[0].passed is True
         assert results[0].scores["tool_selection"] == 0.9
+        assert results[0].avg_score == pytest.approx(0.875)
+
+    def test_msgpack_storage_round_trip(self, tmp_path):
+        """Test payload columns round-trip when stored as MessagePack."""
+        pytest.importorskip("msgpack")
+        from local_runner import LocalDatabase, LocalResult, LocalRun
+
+        db_path = tmp_path / "test.db"
+        db = LocalDatabase(db_path, storage_format="msgpack")
+
+        run = LocalRun(
+            id="test-run-123",
+            suite_id="suite-456",
+            suite_name="test-suite",
+            agent_version=None,
+            trigger="cli-local",
+            status="completed",
+            config={"parallel": False},
+            summary={"total": 1, "passed": 1},
+            started_at="2026-01-22T10:00:00",
+            completed_at="2026-01-22T10:05:00",
+            created_at="2026-01-22T10:00:00",
+        )
+        db.save_run(run)
+        db.save_result(
+            LocalResult(
+                id="result-1",
+                run_id="test-run-123",
+                case_id="case-1",
+                case_name="test_case_1",
+                mlflow_run_id=None,
+                mlflow_trace_id=None,
+                status="success",
+                output={"response": "Test output"},
+                scores={"reasoning": 0.8},
+                score_details={"reasoning": {"score": 0.8, "reason": "Good"}},
+                passed=True,
+                execution_time_ms=100,
+                error=None,
+                created_at="2026-01-22T10:01:00",
+            )
+        )
+
+        with sqlite3.connect(db_path) as conn:
+            output_type = conn.execute("SELECT typeof(output) FROM results").fetchone()[0]
+        assert output_type == "blob"
+
+        # A default (JSON) database reads the msgpack rows back
+        reader = LocalDatabase(db_path)
+        saved_run = reader.get_run("test-run-123")
+        assert saved_run.summary == {"total": 1, "passed": 1}
+        assert saved_run.config == {"parallel": False}
+        result = reader.get_results_for_run("test-run-123")[0]
+        assert result.output == {"response": "Test output"}
+        assert result.score_details["reasoning"]["reason"] == "Good"
+
+    def test_get_runs_with_results(self, tmp_path):
+        """Test loading several runs and their results in one call."""
+        from local_runner import LocalDatabase, LocalResult, LocalRun
+
+        db = LocalDatabase(tmp_path / "test.db")
+
+        for i in range(3):
+            db.save_run(
+                LocalRun(
+                    id=f"run-{i}",
+                    suite_id="suite-1",
+                    suite_name="suite-a",
+                    agent_version=None,
+                    trigger="cli-local",
+                    status="completed",
+                    config=None,
+                    summary=None,
+                    started_at=None,
+                    completed_at=None,
+                    created_at=f"2026-01-22T1{i}:00:00",
+                )
+            )
+        # run-1 is left without results
+        db.save_results_batch(
+            [
+                LocalResult(
+                    id=f"result-{run}-{case}",
+                    run_id=f"run-{run}",
+                    case_id=f"case-{case}",
+                    case_name=f"case_{case}",
+                    mlflow_run_id=None,
+                    mlflow_trace_id=None,
+                    status="success",
+                    output=None,
+                    scores={"reasoning": 0.9},
+                    score_details=None,
+                    passed=True,
+                    execution_time_ms=10,
+                    error=None,
+                    created_at="2026-01-22T10:01:00",
+                )
+                for run in (0, 2)
+                for case in range(2)
+            ]
+        )
+
+        runs = db.get_runs_with_results(["run-2", "missing", "run-1", "run-0"])
+
+        assert [r.id for r in runs] == ["run-2", "run-1", "run-0"]
+        assert [r.case_name for r in runs[0].results] == ["case_0", "case_1"]
+        assert runs[1].results == []
+        assert len(runs[2].results) == 2
+
+    def test_get_run_caches_finished_runs(self, tmp_path):
+        """Test finished runs are served from cache until they are saved again."""
+        from local_runner import LocalDatabase, LocalRun
+
+        db = LocalDatabase(tmp_path / "test.db")
+        run = LocalRun(
+            id="run-1",
+            suite_id="suite-1",
+            suite_name="suite-a",
+            agent_version=None,
+            trigger="cli-local",
+            status="running",
+            config=None,
+            summary=None,
+            started_at=None,
+            completed_at=None,
+            created_at="2026-01-22T10:00:00",
+        )
+        db.save_run(run)
+
+        # In-progress runs are always re-read
+        assert db.get_run("run-1") is not db.get_run("run-1")
+
+        run.status = "completed"
+        db.save_run(run)
+        first = db.get_run("run-1")
+        assert first.status == "completed"
+
+        # Finished runs are served from the cache, not re-read
+        db._conn.execute("UPDATE runs SET suite_name = 'renamed' WHERE id = 'run-1'")
+        assert db.get_run("run-1").suite_name == "suite-a"
+
+        # Saving invalidates the cached copy
+        run.summary = {"passed": 1}
+        db.save_run(run)
+        assert db.get_run("run-1").summary == {"passed": 1}
+
+    def test_get_run_cache_unaffected_by_caller_changes(self, tmp_path):
+        """Test modifying a returned run does not change later get_run results."""
+        from local_runner import LocalDatabase, LocalResult, LocalRun
+
+        db = LocalDatabase(tmp_path / "test.db")
+        db.save_run(
+            LocalRun(
+                id="run-1",
+                suite_id="suite-1",
+                suite_name="suite-a",
+                agent_version=None,
+                trigger="cli-local",
+                status="completed",
+                config={"parallel": True},
+                summary={"passed": 1},
+                started_at=None,
+                completed_at=None,
+                created_at="2026-01-22T10:00:00",
+            )
+        )
+        db.save_results_batch(
+            [
+                LocalResult(
+                    id="result-1",
+                    run_id="run-1",
+                    case_id="case-1",
+                    case_name="case_1",
+                    mlflow_run_id=None,
+                    mlflow_trace_id=None,
+                    status="success",
+                    output=None,
+                    scores={"reasoning": 1.0},
+                    score_details=None,
+                    passed=True,
+                    execution_time_ms=10,
+                    error=None,
+                    created_at="2026-01-22T10:01:00",
+                )
+            ]
+        )
+
+        for _ in range(2):
+            run = db.get_run("run-1")
+            assert [r.id for r in run.results] == ["result-1"]
+            assert run.summary == {"passed": 1}
+            assert run.config == {"parallel": True}
+
+            run.results.clear()
+            run.summary["passed"] = 0
+            run.config["parallel"] = False
+            run.status = "failed"
+
+        assert db.get_run("run-1").status == "completed"
 
     def test_list_runs(self, tmp_path):
         """Test listing runs with filters."""
@@ -160,6 +371,19 @@ class TestLocalDatabase:
         limited_runs = db.list_runs(limit=2)
         assert len(limited_runs) == 2
 
+        # Test offset paging
+        page = db.list_runs(limit=2, offset=2)
+        assert [r.id for r in page] == ["run-2", "run-1"]
+
+        # Test column projection
+        projected = db.list_runs(limit=1, columns=("status",))
+        assert projected[0].id == "run-4"
+        assert projected[0].status == "completed"
+        assert projected[0].suite_name is None
+
+        with pytest.raises(ValueError, match="Unknown run column"):
+            db.list_runs(columns=("id; DROP TABLE runs",))
+
     def test_get_results_failed_only(self, tmp_path):
         """Test filtering results by passed status."""
         from local_runner import LocalDatabase, LocalResult, LocalRun
@@ -210,6 +434,36 @@ class TestLocalDatabase:
         assert len(failed_results) == 2
         assert all(not r.passed for r in failed_results)
 
+    def test_concurrent_saves_share_connection(self, tmp_path):
+        """Test results saved from many threads all land on the shared connection."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from local_runner import LocalDatabase, LocalResult
+
+        def make_result(i: int) -> LocalResult:
+            return LocalResult(
+                id=f"result-{i}",
+                run_id="test-run-123",
+                case_id=f"case-{i}",
+                case_name=f"test_case_{i}",
+                mlflow_run_id=None,
+                mlflow_trace_id=None,
+                status="success",
+                output=None,
+                scores={"tool_selection": 0.9},
+                score_details=None,
+                passed=True,
+                execution_time_ms=10,
+                error=None,
+                created_at="2026-01-22T10:01:00",
+            )
+
+        with LocalDatabase(tmp_path / "test.db") as db:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(db.save_result, map(make_result, range(50))))
+
+            assert len(db.get_results_for_run("test-run-123")) == 50
+
 
 class TestLocalSuite:
     """Tests for suite loading."""
@@ -261,6 +515,38 @@ cases:
         assert suite.cases[0].min_score == 0.8
         assert suite.cases[1].expected_tools == ["search"]
 
+    def test_load_suite_compiles_output_patterns_once(self, tmp_path):
+        """Test cases sharing an expected_output_pattern share one compiled regex."""
+        from local_runner import LocalRunner
+
+        suite_path = tmp_path / "test-suite.yaml"
+        suite_path.write_text(
+            """
+name: test-suite
+agent_id: test-agent
+cases:
+  - name: case_1
+    input:
+      query: "first"
+    expected_output_pattern: "refund.*processed"
+  - name: case_2
+    input:
+      query: "second"
+    expected_output_pattern: "refund.*processed"
+  - name: case_3
+    input:
+      query: "third"
+"""
+        )
+
+        runner = LocalRunner(db=MagicMock())
+        suite = runner.load_suite_from_file(suite_path)
+
+        first, second, third = suite.cases
+        assert first.compiled_output_pattern is second.compiled_output_pattern
+        assert first.compiled_output_pattern.search("Refund was PROCESSED")
+        assert third.compiled_output_pattern is None
+
 
 class TestCaseModelAdapter:
     """Tests for CaseModelAdapter."""
@@ -488,6 +774,23 @@ class TestCompareLocalRuns:
         with pytest.raises(ValueError, match="Baseline run not found"):
             compare_local_runs("nonexistent", "also-nonexistent", db=db)
 
+    def test_vectorized_deltas_match_loop(self):
+        """Test the NumPy delta path classifies pairs the same as the loop."""
+        pytest.importorskip("numpy")
+        import local_runner
+
+        pairs = [
+            (f"case_{i}", "reasoning", 0.5, 0.5 + ((i % 7) - 3) * 0.03)
+            for i in range(local_runner._VECTORIZE_MIN_PAIRS)
+        ]
+
+        vectorized = local_runner._classify_score_deltas(pairs, 0.05)
+        with patch.object(local_runner, "np", None):
+            looped = local_runner._classify_score_deltas(pairs, 0.05)
+
+        assert vectorized == looped
+        assert vectorized[0] and vectorized[1] and vectorized[2]
+
 
 class TestLocalMLflowClient:
     """Tests for LocalMLflowClient."""
@@ -531,16 +834,71 @@ class TestLocalMLflowClient:
         mock_mlflow.set_experiment.assert_called_with("neon-local-test-suite")
         assert exp_id == "exp-123"
 
+    @patch("local_runner.mlflow")
+    @patch("local_runner.MlflowClient")
+    def test_tracing_disabled_skips_mlflow(self, mock_client, mock_mlflow):
+        """Test disabling tracing runs the agent without touching MLflow."""
+        from local_runner import LocalMLflowClient
+
+        with patch.dict(os.environ, {"NEON_LOCAL_DISABLE_TRACING": "1"}):
+            client = LocalMLflowClient()
+
+        assert client.set_experiment("test-suite") is None
+        result = client.execute_with_tracing(lambda query: {"answer": query}, {"query": "hi"})
+
+        assert result["status"] == "success"
+        assert result["output"] == {"answer": "hi"}
+        assert result["mlflow_run_id"] is None
+        assert result["trace_summary"] is None
+        mock_mlflow.set_experiment.assert_not_called()
+        mock_mlflow.start_run.assert_not_called()
+
+    @patch("local_runner.mlflow")
+    @patch("local_runner.MlflowClient")
+    def test_extract_trace_summary(self, mock_client, mock_mlflow):
+        """Test spans are classified and token counts summed from LLM spans."""
+        from local_runner import LocalMLflowClient, SpanType
+
+        def _span(name, span_type, attributes=None):
+            s = MagicMock(span_type=span_type, attributes=attributes)
+            s.name = name
+            return s
+
+        trace = MagicMock()
+        trace.info.request_id = "trace-1"
+        trace.info.status = "OK"
+        trace.info.execution_time_ms = 42
+        trace.data.spans = [
+            _span("agent", SpanType.AGENT),
+            _span("search", SpanType.TOOL),
+            _span(
+                "llm",
+                SpanType.CHAT_MODEL,
+                {"llm.token_count.total": 30, "llm.token_count.prompt": 20, "llm.token_count.completion": 10},
+            ),
+            _span("calculate", SpanType.TOOL),
+            _span("llm", SpanType.CHAT_MODEL, None),
+        ]
+
+        summary = LocalMLflowClient()._extract_trace_summary(trace)
+
+        assert summary["total_spans"] == 5
+        assert summary["tool_calls"] == ["search", "calculate"]
+        assert summary["llm_calls"] == 2
+        assert summary["total_tokens"] == 30
+        assert summary["input_tokens"] == 20
+        assert summary["output_tokens"] == 10
+        assert summary["duration_ms"] == 42
+
 
 class TestLocalRunnerExecution:
     """Tests for LocalRunner execution."""
 
-    def test_calculate_summary(self, tmp_path):
-        """Test summary calculation."""
-        from local_runner import LocalDatabase, LocalResult, LocalRunner
+    def test_summarize_run(self, tmp_path):
+        """Test summary calculation over saved results."""
+        from local_runner import LocalDatabase, LocalResult
 
         db = LocalDatabase(tmp_path / "test.db")
-        runner = LocalRunner(db=db)
 
         results = [
             LocalResult(
@@ -593,7 +951,8 @@ class TestLocalRunnerExecution:
             ),
         ]
 
-        summary = runner._calculate_summary(results)
+        db.save_results_batch(results)
+        summary = db.summarize_run("run-1")
 
         assert summary["total_cases"] == 3
         assert summary["passed"] == 1
@@ -602,6 +961,271 @@ class TestLocalRunnerExecution:
         assert summary["execution_time_ms"] == 3500
         assert "avg_score" in summary
         assert "scores_by_type" in summary
+        assert summary["avg_score"] == 0.75
+        assert summary["scores_by_type"] == {"tool_selection": 0.8, "reasoning": 0.7}
+
+    def test_execute_case_runs_scorers_concurrently(self, tmp_path):
+        """Test a case's scorers are awaited together rather than one by one."""
+        import asyncio
+
+        from local_runner import LocalCase, LocalDatabase, LocalRun, LocalRunner, LocalSuite
+
+        mock_mlflow_client = MagicMock()
+        mock_mlflow_client.execute_with_tracing.return_value = {
+            "mlflow_run_id": None,
+            "mlflow_trace_id": None,
+            "output": {"response": "ok"},
+            "status": "success",
+            "error": None,
+            "execution_time_ms": 1,
+            "trace_summary": None,
+        }
+        runner = LocalRunner(db=LocalDatabase(tmp_path / "test.db"), mlflow_client=mock_mlflow_client)
+
+        # The first scorer can only finish once the second has started
+        second_started = asyncio.Event()
+
+        def make_scorer(value: float, wait: bool) -> MagicMock:
+            scorer = MagicMock()
+
+            async def score(*args, **kwargs):
+                if wait:
+                    await second_started.wait()
+                else:
+                    second_started.set()
+                return MagicMock(score=value, reason="ok", evidence=[])
+
+            scorer.score = score
+            return scorer
+
+        runner.scorers = {
+            "tool_selection": make_scorer(0.8, wait=True),
+            "reasoning": make_scorer(1.0, wait=False),
+        }
+
+        case = LocalCase(
+            id="case-1",
+            name="test_case",
+            description=None,
+            input={"query": "hi"},
+            expected_tools=None,
+            expected_tool_sequence=None,
+            expected_output_contains=None,
+            expected_output_pattern=None,
+            scorers=["tool_selection", "reasoning"],
+            scorer_config=None,
+            min_score=0.7,
+            timeout_seconds=5,
+            tags=[],
+        )
+        suite = LocalSuite(
+            id="suite-1", name="s", description=None, agent_id="a", config={}, cases=[case]
+        )
+        run = LocalRun(
+            id="run-1",
+            suite_id="suite-1",
+            suite_name="s",
+            agent_version=None,
+            trigger="cli-local",
+            status="running",
+            config=None,
+            summary=None,
+            started_at=None,
+            completed_at=None,
+            created_at="2026-01-22T10:00:00",
+        )
+
+        result = runner._execute_case(run, case, suite, MagicMock())
+        runner.close()
+
+        assert result.status == "success"
+        assert result.scores == {"tool_selection": 0.8, "reasoning": 1.0}
+
+    def test_parallel_run_bounded_by_max_workers(self, tmp_path):
+        """Test parallel runs never have more than max_workers cases in flight."""
+        import threading
+        import time
+
+        from local_runner import LocalCase, LocalDatabase, LocalRunner, LocalSuite
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def execute_with_tracing(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {
+                "mlflow_run_id": None,
+                "mlflow_trace_id": None,
+                "output": {"response": "ok"},
+                "status": "success",
+                "error": None,
+                "execution_time_ms": 20,
+                "trace_summary": None,
+            }
+
+        mock_mlflow_client = MagicMock()
+        mock_mlflow_client.execute_with_tracing.side_effect = execute_with_tracing
+
+        async def score(*args, **kwargs):
+            return MagicMock(score=0.9, reason="ok", evidence=[])
+
+        scorer = MagicMock()
+        scorer.score = score
+
+        db = LocalDatabase(tmp_path / "test.db")
+        runner = LocalRunner(db=db, mlflow_client=mock_mlflow_client, max_workers=2)
+        runner.scorers = {"tool_selection": scorer}
+
+        suite = LocalSuite(
+            id="suite-1",
+            name="test-suite",
+            description=None,
+            agent_id="test-agent",
+            config={"parallel": True},
+            cases=[
+                LocalCase(
+                    id=f"case-{i}",
+                    name=f"case_{i}",
+                    description=None,
+                    input={"query": f"q{i}"},
+                    expected_tools=None,
+                    expected_tool_sequence=None,
+                    expected_output_contains=None,
+                    expected_output_pattern=None,
+                    scorers=["tool_selection"],
+                    scorer_config=None,
+                    min_score=0.7,
+                    timeout_seconds=5,
+                    tags=[],
+                )
+                for i in range(6)
+            ],
+        )
+
+        run = runner.execute_run(suite=suite, agent=MagicMock(), parallel=True)
+
+        assert run.status == "completed"
+        assert [r.case_name for r in run.results] == [f"case_{i}" for i in range(6)]
+        assert all(r.passed for r in run.results)
+        assert 1 <= peak <= 2
+        assert len(db.get_results_for_run(run.id)) == 6
+
+    def test_sequential_run_overlaps_scoring_with_next_case(self, tmp_path):
+        """Test sequential runs score a case while the agent runs the next one."""
+        import asyncio
+
+        from local_runner import LocalCase, LocalDatabase, LocalRunner, LocalSuite
+
+        events: list[str] = []
+
+        def execute_with_tracing(**kwargs):
+            events.append(f"trace:{kwargs['run_name'].rsplit('/', 1)[-1]}")
+            return {
+                "mlflow_run_id": None,
+                "mlflow_trace_id": None,
+                "output": {"response": "ok"},
+                "status": "success",
+                "error": None,
+                "execution_time_ms": 1,
+                "trace_summary": None,
+            }
+
+        mock_mlflow_client = MagicMock()
+        mock_mlflow_client.execute_with_tracing.side_effect = execute_with_tracing
+
+        async def score(case, output, config):
+            await asyncio.sleep(0.05)
+            events.append(f"scored:{case.name}")
+            return MagicMock(score=0.9, reason="ok", evidence=[])
+
+        scorer = MagicMock()
+        scorer.score = score
+
+        db = LocalDatabase(tmp_path / "test.db")
+        runner = LocalRunner(db=db, mlflow_client=mock_mlflow_client)
+        runner.scorers = {"tool_selection": scorer}
+
+        suite = LocalSuite(
+            id="suite-1",
+            name="test-suite",
+            description=None,
+            agent_id="test-agent",
+            config={"parallel": False},
+            cases=[
+                LocalCase(
+                    id=f"case-{i}",
+                    name=f"case_{i}",
+                    description=None,
+                    input={"query": f"q{i}"},
+                    expected_tools=None,
+                    expected_tool_sequence=None,
+                    expected_output_contains=None,
+                    expected_output_pattern=None,
+                    scorers=["tool_selection"],
+                    scorer_config=None,
+                    min_score=0.7,
+                    timeout_seconds=5,
+                    tags=[],
+                )
+                for i in range(3)
+            ],
+        )
+
+        try:
+            run = runner.execute_run(suite=suite, agent=MagicMock(), parallel=False)
+        finally:
+            runner.close()
+
+        assert run.status == "completed"
+        assert [r.case_name for r in run.results] == ["case_0", "case_1", "case_2"]
+        assert all(r.passed for r in run.results)
+        # case_1's agent call started before case_0 finished scoring
+        assert events.index("trace:case_1") < events.index("scored:case_0")
+
+    def test_resolve_scorers_warns_on_unknown(self):
+        """Test scorers are resolved once per run and unknown names are reported."""
+        from local_runner import LocalCase, LocalRunner, LocalSuite
+
+        scorer = MagicMock()
+        runner = LocalRunner(db=MagicMock(), mlflow_client=MagicMock())
+        runner.scorers = {"tool_selection": scorer, "reasoning": MagicMock()}
+
+        suite = LocalSuite(
+            id="suite-1",
+            name="test-suite",
+            description=None,
+            agent_id="test-agent",
+            config={},
+            cases=[
+                LocalCase(
+                    id="case-1",
+                    name="case_1",
+                    description=None,
+                    input={},
+                    expected_tools=None,
+                    expected_tool_sequence=None,
+                    expected_output_contains=None,
+                    expected_output_pattern=None,
+                    scorers=["tool_selection", "custom_judge"],
+                    scorer_config=None,
+                    min_score=0.7,
+                    timeout_seconds=5,
+                    tags=[],
+                )
+            ],
+        )
+
+        with pytest.warns(UserWarning, match="custom_judge"):
+            resolved = runner._resolve_scorers(suite)
+
+        assert resolved == {"tool_selection": scorer}
 
 
 class TestIntegrationWorkflow:
@@ -699,6 +1323,8 @@ class TestIntegrationWorkflow:
         # Verify results were saved
         saved_results = db.get_results_for_run(run.id)
         assert len(saved_results) == 1
+        assert saved_run.summary["passed"] == 1
+        assert saved_run.summary["scores_by_type"] == {"tool_selection": 0.9}
 
 
 if __name__ == "__main__":
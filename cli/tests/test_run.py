@@ -0,0 +1,116 @@
+"""Tests for run commands."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+# Add the cli root to path so the src package resolves
+cli_path = str(Path(__file__).parent.parent)
+if cli_path not in sys.path:
+    sys.path.insert(0, cli_path)
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the API client's requests to a handler; returns the request log."""
+    requests: list[tuple[str, str]] = []
+    real_client = httpx.Client
+
+    def install(handler):
+        def logged(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.url.path))
+            return handler(request)
+
+        def make_client(**kwargs):
+            return real_client(transport=httpx.MockTransport(logged), **kwargs)
+
+        monkeypatch.setattr(httpx, "Client", make_client)
+        return requests
+
+    monkeypatch.setattr("src.commands.run.time.sleep", lambda _: None)
+    return install
+
+
+def _run_handler(events: bytes | None, statuses: list[str]):
+    """Serve an event stream (or 404 when None) and polled run statuses."""
+    polled = iter(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/events"):
+            if events is None:
+                return httpx.Response(404)
+            return httpx.Response(
+                200, content=events, headers={"Content-Type": "text/event-stream"}
+            )
+        return httpx.Response(200, json={"id": "run-1", "status": next(polled)})
+
+    return handler
+
+
+def _wait(run_id: str = "run-1") -> dict:
+    from src.client import Client
+    from src.commands.run import _wait_for_run
+
+    client = Client(api_url="http://test", api_key="key")
+    return _wait_for_run(client, run_id, MagicMock(), MagicMock())
+
+
+class TestWaitForRun:
+    """Tests for _wait_for_run."""
+
+    def test_returns_when_stream_reaches_terminal_status(self, serve):
+        """Test a terminal event ends the wait with a single run lookup."""
+        events = b'data: {"status": "running"}\n\ndata: {"status": "completed"}\n\n'
+        requests = serve(_run_handler(events, ["completed"]))
+
+        run = _wait()
+
+        assert run["status"] == "completed"
+        assert requests == [
+            ("GET", "/api/v1/runs/run-1/events"),
+            ("GET", "/api/v1/runs/run-1"),
+        ]
+
+    def test_polls_when_events_endpoint_missing(self, serve):
+        """Test a 404 from the events endpoint falls back to polling."""
+        requests = serve(_run_handler(None, ["running", "completed"]))
+
+        run = _wait()
+
+        assert run["status"] == "completed"
+        assert requests.count(("GET", "/api/v1/runs/run-1")) == 2
+
+    def test_polls_when_stream_closes_early(self, serve):
+        """Test a stream that ends before a terminal status falls back to polling."""
+        requests = serve(_run_handler(b'data: {"status": "running"}\n\n', ["failed"]))
+
+        run = _wait()
+
+        assert run["status"] == "failed"
+        assert requests[-1] == ("GET", "/api/v1/runs/run-1")
+
+    def test_polls_when_event_is_not_json(self, serve):
+        """Test an undecodable event falls back to polling instead of crashing."""
+        serve(_run_handler(b"data: <html>\n\n", ["completed"]))
+
+        run = _wait()
+
+        assert run["status"] == "completed"
+
+    def test_polls_when_stream_connection_drops(self, serve):
+        """Test a transport error on the stream falls back to polling."""
+        polled = _run_handler(None, ["completed"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/events"):
+                raise httpx.RemoteProtocolError("peer closed connection", request=request)
+            return polled(request)
+
+        serve(handler)
+
+        run = _wait()
+
+        assert run["status"] == "completed"
@@ -1,6 +1,13 @@
 """Example agents for Neon evaluation testing."""
 
-from examples.agents.demo_agent import DemoAgent, run as demo_run
-from examples.agents.mock_agent import MockAgent, run as mock_run
+from examples.agents.demo_agent import DemoAgent, run as demo_run, run_batch as demo_run_batch
+from examples.agents.mock_agent import MockAgent, run as mock_run, run_batch as mock_run_batch
 
-__all__ = ["DemoAgent", "MockAgent", "demo_run", "mock_run"]
+__all__ = [
+    "DemoAgent",
+    "MockAgent",
+    "demo_run",
+    "demo_run_batch",
+    "mock_run",
+    "mock_run_batch",
+]
@@ -21,27 +21,209 @@ This agent is designed to work with the demo-suite.yaml evaluation suite.
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Any, Callable
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar
+
+from examples.agents.keywords import KeywordMatcher
+
+# Query keywords that select each tool in _analyze_query
+SEARCH_KEYWORDS = (
+    "capital", "population", "gdp", "country", "city",
+    "current", "latest", "who", "when", "where",
+    "find", "search", "look up", "information about",
+)
+CALC_KEYWORDS = (
+    "calculate", "compute", "multiply", "divide", "add",
+    "subtract", "interest", "percentage", "math",
+)
+SUMMARY_KEYWORDS = ("summarize", "summary", "key points", "main ideas")
+
+_KEYWORD_TOOLS: dict[str, str] = {
+    **dict.fromkeys(SEARCH_KEYWORDS, "web_search"),
+    **dict.fromkeys(CALC_KEYWORDS, "calculator"),
+    **dict.fromkeys(SUMMARY_KEYWORDS, "summarize"),
+}
+_TOOL_MATCHER = KeywordMatcher(_KEYWORD_TOOLS)
 
 
 class Tool:
-    """Represents a callable tool with metadata."""
+    """Represents a callable tool with metadata.
+
+    Tools marked cacheable are pure functions of their arguments, and their
+    results are memoized per argument.
+    """
 
     def __init__(
         self,
         name: str,
         description: str,
         fn: Callable[..., str],
+        cacheable: bool = False,
     ) -> None:
         self.name = name
         self.description = description
-        self.fn = fn
+        self.cacheable = cacheable
+        self.fn = functools.lru_cache(maxsize=1024)(fn) if cacheable else fn
 
     def __call__(self, *args: Any, **kwargs: Any) -> str:
         return self.fn(*args, **kwargs)
 
 
+# Simulated web search results, keyed by query keyword
+_SEARCH_RESULTS: dict[str, str] = {
+    "capital": "Paris is the capital and largest city of France.",
+    "france": "France is a country in Western Europe with Paris as its capital.",
+    "japan": "Japan has a population of approximately 125 million people as of 2024.",
+    "population": "Population data varies by region and time of measurement.",
+    "tokyo": "Tokyo is the capital of Japan with a population of about 14 million.",
+    "new york": "New York City has a population of approximately 8.3 million.",
+    "gdp": "GDP (Gross Domestic Product) measures economic output. US GDP: ~$25T, China GDP: ~$18T.",
+    "united states": "The United States has the world's largest economy by nominal GDP.",
+    "china": "China has the world's second-largest economy and fastest growth among major economies.",
+    "climate": "Climate change is causing global temperature rise, sea level rise, and extreme weather.",
+    "germany": "Germany is a country in Central Europe with Berlin as its capital.",
+}
+
+
+# The default tools are pure functions of their input, so results are
+# memoized across runs of the same suite.
+@functools.lru_cache(maxsize=512)
+def _web_search(query: str) -> str:
+    """Simulated web search tool."""
+    # Simulated search results based on query keywords
+    query_lower = query.lower()
+    for keyword, result in _SEARCH_RESULTS.items():
+        if keyword in query_lower:
+            return result
+
+    return f"Search results for: {query}"
+
+
+# Characters allowed through to the calculator's expression evaluation
+_UNSAFE_CALC_CHARS = re.compile(r"[^0-9+\-*/().\s]")
+
+# A = P(1 + r)^t for annual compounding: $10,000 at 5% for 10 years
+_COMPOUND_PRINCIPAL = 10000
+_COMPOUND_AMOUNT = _COMPOUND_PRINCIPAL * ((1 + 0.05) ** 10)
+_COMPOUND_RESULT = (
+    f"Result: ${_COMPOUND_AMOUNT:,.2f} (principal: ${_COMPOUND_PRINCIPAL:,}, "
+    f"interest: ${_COMPOUND_AMOUNT - _COMPOUND_PRINCIPAL:,.2f})"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> Any:
+    """Compile a sanitized arithmetic expression to a code object."""
+    # eval() of a string drops leading spaces and tabs; compile() does not
+    return compile(expression.lstrip(" \t"), "<calc>", "eval")
+
+
+@functools.lru_cache(maxsize=512)
+def _calculator(expression: str) -> str:
+    """Simulated calculator tool."""
+    try:
+        # Simple compound interest calculation detection
+        if "compound" in expression.lower():
+            return _COMPOUND_RESULT
+
+        # Try to evaluate simple expressions
+        # Only allow safe characters
+        safe_expr = _UNSAFE_CALC_CHARS.sub("", expression)
+        if safe_expr:
+            result = eval(_compile_expression(safe_expr), {"__builtins__": {}}, {})  # noqa: S307
+            return f"Result: {result}"
+
+        return "Unable to calculate expression"
+    except Exception:
+        return "Calculation error"
+
+
+@functools.lru_cache(maxsize=512)
+def _summarize(text: str) -> str:
+    """Simulated summarization tool."""
+    # Simple extractive summary - take first and last sentences, located by
+    # their periods rather than splitting the whole text
+    last_end = text.rfind(".")
+    prev_end = text.rfind(".", 0, last_end) if last_end > 0 else -1
+    if prev_end == -1:
+        return text
+
+    first = text[: text.find(".")].strip()
+    last = text[prev_end + 1 : last_end].strip()
+    return f"Summary: {first}. {last}."
+
+
+def clear_tool_cache() -> None:
+    """Clear the memoized results of the default tools."""
+    _web_search.cache_clear()
+    _calculator.cache_clear()
+    _summarize.cache_clear()
+
+
+def _explain_height_order(agent: DemoAgent) -> str:
+    """Answer the height-ordering puzzle with pure reasoning."""
+    agent.reasoning_steps.append("Analyzing height relationships...")
+    agent.reasoning_steps.append("Alice > Bob > Charlie > Diana")
+    agent.reasoning_steps.append("Diana is at the end of the chain")
+    # Clear any tool calls - this is pure reasoning
+    agent.tools_called = []
+    return "Based on the given information: Alice > Bob > Charlie > Diana in height. Therefore, Diana is the shortest."
+
+
+def _explain_train_problem(agent: DemoAgent) -> str:
+    """Answer the two-trains word problem step by step."""
+    agent.reasoning_steps.append("Setting up the problem: two trains approaching each other")
+    agent.reasoning_steps.append("Train A: starts at 9:00 AM, 60 mph")
+    agent.reasoning_steps.append("Train B: starts at 9:30 AM, 80 mph, 120 miles away")
+    agent.reasoning_steps.append("Combined speed: 60 + 80 = 140 mph")
+    agent.reasoning_steps.append("In 30 min, Train A travels 30 miles, leaving 90 miles")
+    agent.reasoning_steps.append("Time to meet: 90 / 140 = 0.643 hours = ~39 minutes after 9:30")
+    return "The trains will meet at approximately 10:09 AM, about 1 hour and 9 minutes after the first train departs."
+
+
+# Canned responses for _generate_response, as (required substrings, response)
+# pairs checked in order. A response is a string or a handler called with the
+# agent. Rules here take priority over tool results.
+_PRIORITY_RULES: tuple[tuple[tuple[str, ...], str | Callable[[DemoAgent], str]], ...] = (
+    # Handle logical reasoning
+    (("alice", "bob"), _explain_height_order),
+    # Handle arithmetic
+    (("2 + 2",), "The answer is 4."),
+    (("2+2",), "The answer is 4."),
+    (("15", "7", "multipl"), "15 multiplied by 7 equals 105."),
+)
+
+# Rules checked when there are no tool results or document answers
+_FALLBACK_RULES: tuple[tuple[tuple[str, ...], str | Callable[[DemoAgent], str]], ...] = (
+    # Handle word problems
+    (("train", "station"), _explain_train_problem),
+    # Handle simple factual
+    (("capital", "germany"), "Berlin is the capital of Germany."),
+)
+
+_AMBIGUOUS_QUERIES = frozenset({"what's the best one?", "which is best?", "best one?"})
+
+_RULE_MATCHER = KeywordMatcher(
+    keyword for required, _ in _PRIORITY_RULES + _FALLBACK_RULES for keyword in required
+)
+
+
+def _apply_rules(
+    agent: DemoAgent,
+    rules: tuple[tuple[tuple[str, ...], str | Callable[[DemoAgent], str]], ...],
+    matched: set[str],
+) -> str | None:
+    """Return the response of the first rule whose substrings all matched."""
+    for required, response in rules:
+        if matched.issuperset(required):
+            return response if isinstance(response, str) else response(agent)
+    return None
+
+
 class DemoAgent:
     """Demo agent with tool simulation and reasoning.
 
@@ -52,38 +234,26 @@ class DemoAgent:
     - Structured output format
     """
 
+    # Default tools, shared by every instance until it registers its own
+    _DEFAULT_TOOLS: ClassVar[Mapping[str, Tool]] = MappingProxyType({
+        "web_search": Tool("web_search", "Search the web for information", _web_search),
+        "calculator": Tool("calculator", "Perform mathematical calculations", _calculator),
+        "summarize": Tool("summarize", "Summarize a block of text", _summarize),
+    })
+
     def __init__(self) -> None:
         """Initialize the demo agent with available tools."""
-        self.tools: dict[str, Tool] = {}
+        self.tools: Mapping[str, Tool] = self._DEFAULT_TOOLS
+        self._tool_names: tuple[str, ...] = tuple(self.tools)
         self.tools_called: list[str] = []
         self.reasoning_steps: list[str] = []
 
-        # Register default tools
-        self._register_default_tools()
-
-    def _register_default_tools(self) -> None:
-        """Register the default set of tools."""
-        self.register_tool(
-            "web_search",
-            "Search the web for information",
-            self._web_search,
-        )
-        self.register_tool(
-            "calculator",
-            "Perform mathematical calculations",
-            self._calculator,
-        )
-        self.register_tool(
-            "summarize",
-            "Summarize a block of text",
-            self._summarize,
-        )
-
     def register_tool(
         self,
         name: str,
         description: str,
         fn: Callable[..., str],
+        cacheable: bool = False,
     ) -> None:
         """Register a tool with the agent.
 
@@ -91,110 +261,42 @@ class DemoAgent:
             name: Tool identifier
             description: Human-readable description
             fn: The tool function
+            cacheable: Memoize results; only for pure functions of the input
         """
-        self.tools[name] = Tool(name, description, fn)
-
-    def _web_search(self, query: str) -> str:
-        """Simulated web search tool."""
-        # Simulated search results based on query keywords
-        results = {
-            "capital": "Paris is the capital and largest city of France.",
-            "france": "France is a country in Western Europe with Paris as its capital.",
-            "japan": "Japan has a population of approximately 125 million people as of 2024.",
-            "population": "Population data varies by region and time of measurement.",
-            "tokyo": "Tokyo is the capital of Japan with a population of about 14 million.",
-            "new york": "New York City has a population of approximately 8.3 million.",
-            "gdp": "GDP (Gross Domestic Product) measures economic output. US GDP: ~$25T, China GDP: ~$18T.",
-            "united states": "The United States has the world's largest economy by nominal GDP.",
-            "china": "China has the world's second-largest economy and fastest growth among major economies.",
-            "climate": "Climate change is causing global temperature rise, sea level rise, and extreme weather.",
-            "germany": "Germany is a country in Central Europe with Berlin as its capital.",
-        }
+        # Copy the shared defaults on first registration
+        if self.tools is self._DEFAULT_TOOLS:
+            self.tools = dict(self._DEFAULT_TOOLS)
+        self.tools[name] = Tool(name, description, fn, cacheable=cacheable)
+        self._tool_names = tuple(self.tools)
 
-        for keyword, result in results.items():
-            if keyword in query.lower():
-                return result
-
-        return f"Search results for: {query}"
-
-    def _calculator(self, expression: str) -> str:
-        """Simulated calculator tool."""
-        try:
-            # Simple compound interest calculation detection
-            if "compound" in expression.lower():
-                # A = P(1 + r)^t for annual compounding
-                # $10,000 at 5% for 10 years
-                principal = 10000
-                rate = 0.05
-                years = 10
-                amount = principal * ((1 + rate) ** years)
-                return f"Result: ${amount:,.2f} (principal: ${principal:,}, interest: ${amount - principal:,.2f})"
-
-            # Try to evaluate simple expressions
-            # Only allow safe characters
-            safe_expr = re.sub(r"[^0-9+\-*/().\s]", "", expression)
-            if safe_expr:
-                result = eval(safe_expr)  # noqa: S307
-                return f"Result: {result}"
-
-            return "Unable to calculate expression"
-        except Exception:
-            return "Calculation error"
-
-    def _summarize(self, text: str) -> str:
-        """Simulated summarization tool."""
-        # Simple extractive summary - take first and last sentences
-        sentences = text.split(".")
-        if len(sentences) <= 2:
-            return text
-
-        summary = f"{sentences[0].strip()}. {sentences[-2].strip()}."
-        return f"Summary: {summary}"
-
-    def _analyze_query(self, query: str, context: dict[str, Any]) -> list[str]:
+    def _analyze_query(self, query_lower: str, context: dict[str, Any]) -> list[str]:
         """Determine which tools to use based on query analysis.
 
         Args:
-            query: The input query
+            query_lower: The lowercased input query
             context: Context dictionary
 
         Returns:
             List of tool names to use
         """
-        tools_to_use = []
-        query_lower = query.lower()
+        # Insertion-ordered set: re-adding a tool keeps its first position
+        tools_to_use: dict[str, None] = {}
 
         # Check context hints first
         if context.get("require_search"):
-            tools_to_use.append("web_search")
+            tools_to_use["web_search"] = None
 
         if context.get("require_summary"):
-            tools_to_use.append("summarize")
-
-        # Analyze query for tool needs
-        search_keywords = [
-            "capital", "population", "gdp", "country", "city",
-            "current", "latest", "who", "when", "where",
-            "find", "search", "look up", "information about",
-        ]
-        calc_keywords = [
-            "calculate", "compute", "multiply", "divide", "add",
-            "subtract", "interest", "percentage", "math",
-        ]
-        summary_keywords = ["summarize", "summary", "key points", "main ideas"]
+            tools_to_use["summarize"] = None
 
-        if any(kw in query_lower for kw in search_keywords):
-            if "web_search" not in tools_to_use:
-                tools_to_use.append("web_search")
+        # Analyze query for tool needs in a single scan
+        matched_tools = {_KEYWORD_TOOLS[kw] for kw in _TOOL_MATCHER.matches(query_lower)}
 
-        if any(kw in query_lower for kw in calc_keywords):
-            tools_to_use.append("calculator")
+        for tool_name in ("web_search", "calculator", "summarize"):
+            if tool_name in matched_tools:
+                tools_to_use[tool_name] = None
 
-        if any(kw in query_lower for kw in summary_keywords):
-            if "summarize" not in tools_to_use:
-                tools_to_use.append("summarize")
-
-        return tools_to_use
+        return list(tools_to_use)
 
     def _execute_tools(
         self,
@@ -219,16 +321,11 @@ class DemoAgent:
                 self.tools_called.append(tool_name)
                 self.reasoning_steps.append(f"Using tool: {tool_name}")
 
-                tool = self.tools[tool_name]
-                if tool_name == "web_search":
-                    result = tool(query)
-                elif tool_name == "calculator":
-                    result = tool(query)
-                elif tool_name == "summarize":
-                    doc = context.get("document", query)
-                    result = tool(doc)
+                # Summarize works on the context document; other tools on the query
+                if tool_name == "summarize":
+                    result = self.tools[tool_name](context.get("document", query))
                 else:
-                    result = tool(query)
+                    result = self.tools[tool_name](query)
 
                 results[tool_name] = result
                 self.reasoning_steps.append(f"Tool result: {result[:100]}...")
@@ -238,6 +335,7 @@ class DemoAgent:
     def _generate_response(
         self,
         query: str,
+        query_lower: str,
         context: dict[str, Any],
         tool_results: dict[str, str],
     ) -> str:
@@ -245,31 +343,19 @@ class DemoAgent:
 
         Args:
             query: The original query
+            query_lower: The lowercased query
             context: Context dictionary
             tool_results: Results from tool execution
 
         Returns:
             The generated response string
         """
-        query_lower = query.lower()
-
-        # Check for special cases that don't need tool results first
-
-        # Handle logical reasoning (priority over tool results)
-        if "alice" in query_lower and "bob" in query_lower:
-            self.reasoning_steps.append("Analyzing height relationships...")
-            self.reasoning_steps.append("Alice > Bob > Charlie > Diana")
-            self.reasoning_steps.append("Diana is at the end of the chain")
-            # Clear any tool calls - this is pure reasoning
-            self.tools_called = []
-            return "Based on the given information: Alice > Bob > Charlie > Diana in height. Therefore, Diana is the shortest."
-
-        # Handle arithmetic (priority over tool results)
-        if "2 + 2" in query_lower or "2+2" in query_lower:
-            return "The answer is 4."
-
-        if "15" in query_lower and "7" in query_lower and "multipl" in query_lower:
-            return "15 multiplied by 7 equals 105."
+        # Check for special cases that don't need tool results first,
+        # scanning the query for every rule keyword in one pass
+        matched = _RULE_MATCHER.matches(query_lower)
+        response = _apply_rules(self, _PRIORITY_RULES, matched)
+        if response is not None:
+            return response
 
         # If we have tool results, use them
         if tool_results:
@@ -286,24 +372,14 @@ class DemoAgent:
             if "color" in query_lower:
                 return "The color of the XZ-5000 is not specified in the provided documentation."
 
-        # Handle word problems
-        if "train" in query_lower and "station" in query_lower:
-            self.reasoning_steps.append("Setting up the problem: two trains approaching each other")
-            self.reasoning_steps.append("Train A: starts at 9:00 AM, 60 mph")
-            self.reasoning_steps.append("Train B: starts at 9:30 AM, 80 mph, 120 miles away")
-            self.reasoning_steps.append("Combined speed: 60 + 80 = 140 mph")
-            self.reasoning_steps.append("In 30 min, Train A travels 30 miles, leaving 90 miles")
-            self.reasoning_steps.append("Time to meet: 90 / 140 = 0.643 hours = ~39 minutes after 9:30")
-            return "The trains will meet at approximately 10:09 AM, about 1 hour and 9 minutes after the first train departs."
+        response = _apply_rules(self, _FALLBACK_RULES, matched)
+        if response is not None:
+            return response
 
         # Handle ambiguous queries
-        if query_lower.strip() in ["what's the best one?", "which is best?", "best one?"]:
+        if query_lower.strip() in _AMBIGUOUS_QUERIES:
             return "I need more context to answer that question. Could you please specify what you're asking about?"
 
-        # Handle simple factual
-        if "capital" in query_lower and "germany" in query_lower:
-            return "Berlin is the capital of Germany."
-
         # Default response
         return f"I have processed your query: {query}"
 
@@ -332,7 +408,8 @@ class DemoAgent:
         self.reasoning_steps.append("Analyzing query to determine required tools...")
 
         # Analyze query and select tools
-        tools_to_use = self._analyze_query(query, context)
+        query_lower = query.lower()
+        tools_to_use = self._analyze_query(query_lower, context)
 
         if tools_to_use:
             self.reasoning_steps.append(f"Selected tools: {tools_to_use}")
@@ -344,7 +421,7 @@ class DemoAgent:
 
         # Generate response
         self.reasoning_steps.append("Generating response...")
-        output = self._generate_response(query, context, tool_results)
+        output = self._generate_response(query, query_lower, context, tool_results)
 
         # Build result
         return {
@@ -353,8 +430,8 @@ class DemoAgent:
             "reasoning": "\n".join(self.reasoning_steps),
             "metadata": {
                 "agent": "demo_agent",
-                "tools_available": list(self.tools.keys()),
-                "context_keys": list(context.keys()),
+                "tools_available": self._tool_names,
+                "context_keys": list(context),
             },
         }
 
@@ -374,5 +451,38 @@ def run(
     Returns:
         Response dictionary with output, tools_called, reasoning, and metadata
     """
-    agent = DemoAgent()
-    return agent.run(query, context)
+    return _thread_agent().run(query, context)
+
+
+def run_batch(
+    queries: list[str],
+    contexts: list[dict[str, Any] | None] | None = None,
+) -> list[dict[str, Any]]:
+    """Run a batch of queries through one shared demo agent.
+
+    Args:
+        queries: The input queries
+        contexts: Optional contexts, one per query
+
+    Returns:
+        One response dictionary per query, in order
+    """
+    if contexts is None:
+        contexts = [None] * len(queries)
+    elif len(contexts) != len(queries):
+        raise ValueError(f"Got {len(contexts)} contexts for {len(queries)} queries")
+
+    agent_run = _thread_agent().run
+    return [agent_run(query, context) for query, context in zip(queries, contexts)]
+
+
+# One DemoAgent per thread; run() resets its per-call state
+_thread_local = threading.local()
+
+
+def _thread_agent() -> DemoAgent:
+    """Return this thread's shared DemoAgent, creating it on first use."""
+    agent = getattr(_thread_local, "agent", None)
+    if agent is None:
+        agent = _thread_local.agent = DemoAgent()
+    return agent
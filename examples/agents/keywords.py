@@ -0,0 +1,79 @@
+"""Single-pass keyword matching for the example agents.
+
+The example agents route queries by checking which of a fixed set of
+keywords appear in the (lowercased) query. ``KeywordMatcher`` builds the
+search structure once so every query is scanned a single time, instead of
+one ``in`` test per keyword.
+
+Uses an Aho-Corasick automaton when ``pyahocorasick`` is installed and
+falls back to a precompiled regex alternation otherwise.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Find every keyword that occurs as a substring of a text.
+
+    Matches have the same semantics as ``keyword in text`` for each
+    keyword, including overlapping keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """Build the matcher.
+
+        Args:
+            keywords: Keywords to search for (matched case-sensitively)
+        """
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(kw for kw in keywords if kw))
+        self._automaton = None
+        self._pattern: re.Pattern[str] | None = None
+
+        if not self.keywords:
+            return
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+            return
+
+        # A lookahead lets the regex report a match at every position, so
+        # overlapping keywords are all found. At a given position only the
+        # longest keyword is reported; the shorter ones starting there are
+        # exactly its keyword prefixes, which are added back from _prefixes.
+        by_length = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile(
+            "(?=(" + "|".join(map(re.escape, by_length)) + "))"
+        )
+        self._prefixes: dict[str, tuple[str, ...]] = {
+            keyword: tuple(
+                other
+                for other in self.keywords
+                if other != keyword and keyword.startswith(other)
+            )
+            for keyword in self.keywords
+        }
+
+    def matches(self, text: str) -> set[str]:
+        """Return the set of keywords found in text."""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+
+        if self._pattern is None:
+            return set()
+
+        found = set(self._pattern.findall(text))
+        for keyword in tuple(found):
+            found.update(self._prefixes[keyword])
+        return found
@@ -24,11 +24,15 @@ Scenarios:
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+from examples.agents.keywords import KeywordMatcher
+
 
 # Predefined responses for specific queries
-QUERY_RESPONSES: dict[str, dict[str, Any]] = {
+QUERY_RESPONSES: dict[str, Mapping[str, Any]] = {
     # Arithmetic
     "what is 2 + 2": {
         "output": "The answer is 4.",
@@ -110,6 +114,24 @@ QUERY_RESPONSES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Responses are built fresh per call, so the shared templates are read-only
+for _key, _value in QUERY_RESPONSES.items():
+    QUERY_RESPONSES[_key] = MappingProxyType(_value)
+del _key, _value
+
+# Single-pass lookup over QUERY_RESPONSES. When several keys occur in a query
+# the earliest one in the table wins, as with a linear scan.
+_RESPONSE_MATCHER = KeywordMatcher(QUERY_RESPONSES)
+_RESPONSE_ORDER = {key: index for index, key in enumerate(QUERY_RESPONSES)}
+
+
+def _match_response(query_lower: str) -> Mapping[str, Any] | None:
+    """Return the canned response for the first table key found in query_lower."""
+    matched = _RESPONSE_MATCHER.matches(query_lower)
+    if not matched:
+        return None
+    return QUERY_RESPONSES[min(matched, key=_RESPONSE_ORDER.__getitem__)]
+
 
 class MockAgent:
     """Mock agent with configurable behavior for testing.
@@ -165,14 +187,8 @@ class MockAgent:
         # Normalize query for lookup
         query_lower = query.lower().strip()
 
-        # Find matching response
-        response = None
-        for key, value in QUERY_RESPONSES.items():
-            if key in query_lower:
-                response = value.copy()
-                break
-
-        # Default response if no match
+        # Find matching response, or the default response if no match
+        response = _match_response(query_lower)
         if response is None:
             response = {
                 "output": f"I processed your query: {query}",
@@ -180,32 +196,50 @@ class MockAgent:
                 "reasoning": "No specific handler for this query.",
             }
 
-        # Modify response based on scenario
+        # Collect scenario overrides; the matched template itself is shared
+        overrides: dict[str, Any] = {}
         if self.scenario == "fail_all":
-            response["output"] = "I don't know the answer."
-            response["tools_called"] = ["wrong_tool"]
-            response["reasoning"] = ""
+            overrides = {
+                "output": "I don't know the answer.",
+                "tools_called": ["wrong_tool"],
+                "reasoning": "",
+            }
 
         elif self.scenario == "mixed":
             # Fail every other query (based on query length)
             if len(query) % 2 == 0:
-                response["output"] = "Unable to process this request."
-                response["tools_called"] = []
+                overrides = {
+                    "output": "Unable to process this request.",
+                    "tools_called": [],
+                }
 
         # Handle context-specific overrides
-        if context.get("require_search") and "web_search" not in response.get("tools_called", []):
-            response["tools_called"] = ["web_search"] + response.get("tools_called", [])
-
-        # Add metadata
-        response["metadata"] = {
-            "agent": "mock_agent",
-            "scenario": self.scenario,
-            "query_length": len(query),
+        tools_called = overrides.get("tools_called", response.get("tools_called", []))
+        if context.get("require_search") and "web_search" not in tools_called:
+            overrides["tools_called"] = ["web_search"] + tools_called
+
+        # Build the response in one merge and add metadata
+        response = {
+            **response,
+            **overrides,
+            "metadata": {
+                "agent": "mock_agent",
+                "scenario": self.scenario,
+                "query_length": len(query),
+            },
         }
 
         return response
 
 
+# MockAgent holds no per-call state, so the module-level entry points share
+# one instance per scenario
+_SCENARIO_AGENTS = {
+    scenario: MockAgent(scenario=scenario)
+    for scenario in ("pass_all", "fail_all", "mixed")
+}
+
+
 def run(
     query: str,
     context: dict[str, Any] | None = None,
@@ -221,21 +255,42 @@ def run(
     Returns:
         Response dictionary with output, tools_called, and metadata
     """
-    agent = MockAgent(scenario="pass_all")
-    return agent.run(query, context)
+    return _SCENARIO_AGENTS["pass_all"].run(query, context)
+
+
+def run_batch(
+    queries: list[str],
+    contexts: list[dict[str, Any] | None] | None = None,
+) -> list[dict[str, Any]]:
+    """Run a batch of queries through the shared pass_all mock agent.
+
+    Args:
+        queries: The input queries
+        contexts: Optional contexts, one per query
+
+    Returns:
+        One response dictionary per query, in order
+    """
+    if contexts is None:
+        contexts = [None] * len(queries)
+    elif len(contexts) != len(queries):
+        raise ValueError(f"Got {len(contexts)} contexts for {len(queries)} queries")
+
+    agent_run = _SCENARIO_AGENTS["pass_all"].run
+    return [agent_run(query, context) for query, context in zip(queries, contexts)]
 
 
 # Convenience functions for different scenarios
 def run_pass_all(query: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
     """Run agent with pass_all scenario."""
-    return MockAgent(scenario="pass_all").run(query, context)
+    return _SCENARIO_AGENTS["pass_all"].run(query, context)
 
 
 def run_fail_all(query: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
     """Run agent with fail_all scenario."""
-    return MockAgent(scenario="fail_all").run(query, context)
+    return _SCENARIO_AGENTS["fail_all"].run(query, context)
 
 
 def run_mixed(query: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
     """Run agent with mixed scenario."""
-    return MockAgent(scenario="mixed").run(query, context)
+    return _SCENARIO_AGENTS["mixed"].run(query, context)
@@ -5,23 +5,40 @@ A simple ReAct-style agent with calculator, weather, and search tools.
 Supports OpenAI, Anthropic, and Google Vertex AI.
 """
 
+import contextvars
+import functools
 import json
+import logging
 import math
 import os
-from typing import Annotated, TypedDict
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType, MappingProxyType
+from typing import Annotated, Any, TypedDict
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_core.tools import tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
 
-from neon_tracer import tracer
+from neon_tracer import tracer, truncate
+
+logger = logging.getLogger("neon.agent")
 
 
 # =============================================================================
 # LLM Provider Setup
 # =============================================================================
 
+# Opt-in exact-match LLM response cache, for replaying the same queries
+if os.getenv("NEON_LLM_CACHE", "").lower() in ("1", "true", "yes"):
+    from langchain_core.caches import InMemoryCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(InMemoryCache())
+
 
 def get_llm(model_name: str):
     """Get the appropriate LLM based on model name or environment.
@@ -46,37 +63,99 @@ def get_llm(model_name: str):
         - GOOGLE_CLOUD_PROJECT: Your GCP project ID (default: sk-ml-inference)
         - GOOGLE_CLOUD_LOCATION: Region (default: global)
     """
+    provider = _llm_provider(model_name)
+    factory = _LLM_FACTORIES.get(provider)
+    if factory is None:
+        factory = _LLM_FACTORIES[provider] = _load_llm_factory(provider)
+    return factory(model_name)
+
+
+# Model name prefixes served by the OpenAI API
+_OPENAI_PREFIXES = ("gpt-", "o1-", "o3-")
+
+# LLM constructors by provider, imported on first use
+_LLM_FACTORIES: dict[str, Callable[[str], Any]] = {}
+
+
+def _llm_provider(model_name: str) -> str:
+    """Map a model name to its provider: openai, anthropic, or vertex."""
     model_lower = model_name.lower()
 
     # OpenAI models
-    if model_lower.startswith(("gpt-", "o1-", "o3-")):
-        from langchain_openai import ChatOpenAI
-        return ChatOpenAI(model=model_name, temperature=0)
+    if model_lower.startswith(_OPENAI_PREFIXES):
+        return "openai"
 
     # Anthropic models (direct API)
     elif model_lower.startswith("claude") and "@" not in model_name:
-        from langchain_anthropic import ChatAnthropic
-        return ChatAnthropic(model=model_name, temperature=0)
+        return "anthropic"
 
     # Vertex AI models (Gemini or Claude via Vertex)
     elif model_lower.startswith("gemini") or "@" in model_name:
+        return "vertex"
+
+    # Default to OpenAI
+    return "openai"
+
+
+def _load_llm_factory(provider: str) -> Callable[[str], Any]:
+    """Import a provider's chat model class and return a constructor for it."""
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return lambda model_name: ChatAnthropic(model=model_name, temperature=0)
+
+    if provider == "vertex":
         from langchain_google_vertexai import ChatVertexAI
 
-        # Service account auth via GOOGLE_APPLICATION_CREDENTIALS env var
-        project = os.getenv("GOOGLE_CLOUD_PROJECT", "sk-ml-inference")
-        location = os.getenv("GOOGLE_CLOUD_LOCATION", "global")
+        def create_vertex(model_name: str) -> Any:
+            # Service account auth via GOOGLE_APPLICATION_CREDENTIALS env var
+            project = os.getenv("GOOGLE_CLOUD_PROJECT", "sk-ml-inference")
+            location = os.getenv("GOOGLE_CLOUD_LOCATION", "global")
 
-        return ChatVertexAI(
-            model=model_name,
-            project=project,
-            location=location,
-            temperature=0,
-        )
+            return ChatVertexAI(
+                model=model_name,
+                project=project,
+                location=location,
+                temperature=0,
+            )
+
+        return create_vertex
+
+    from langchain_openai import ChatOpenAI
 
-    else:
-        # Default to OpenAI
-        from langchain_openai import ChatOpenAI
-        return ChatOpenAI(model=model_name, temperature=0)
+    return lambda model_name: ChatOpenAI(model=model_name, temperature=0)
+
+
+# =============================================================================
+# Token Counting
+# =============================================================================
+
+# Optional exact token counts; falls back to ~4 characters per token
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoding():
+    """Load the tiktoken encoding, or None to use the character estimate."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Encoding files are fetched on first use and may be unavailable
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """Count the tokens in a message's text, cached per distinct text."""
+    encoding = _token_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
 
 
 # =============================================================================
@@ -84,6 +163,32 @@ def get_llm(model_name: str):
 # =============================================================================
 
 
+# Names available to calculator expressions (safe math evaluation)
+_CALC_NAMES = MappingProxyType({
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "pow": pow,
+    "sqrt": math.sqrt,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "pi": math.pi,
+    "e": math.e,
+})
+
+# Common symbols rewritten to Python operators
+_CALC_SYMBOLS = str.maketrans({"^": "**", "×": "*", "÷": "/"})
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expr: str) -> CodeType:
+    """Compile a calculator expression once per distinct input."""
+    return compile(expr, "<string>", "eval")
+
+
 @tool
 def calculator(expression: str) -> str:
     """Evaluate a mathematical expression.
@@ -94,31 +199,31 @@ def calculator(expression: str) -> str:
     Returns:
         The result of the calculation
     """
-    # Safe math evaluation
-    allowed_names = {
-        "abs": abs,
-        "round": round,
-        "min": min,
-        "max": max,
-        "sum": sum,
-        "pow": pow,
-        "sqrt": math.sqrt,
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "pi": math.pi,
-        "e": math.e,
-    }
-
     try:
-        # Replace common symbols
-        expr = expression.replace("^", "**").replace("×", "*").replace("÷", "/")
-        result = eval(expr, {"__builtins__": {}}, allowed_names)
+        result = eval(
+            _compile_expression(expression.translate(_CALC_SYMBOLS)),
+            {"__builtins__": {}},
+            _CALC_NAMES,
+        )
         return str(result)
     except Exception as e:
         return f"Error: {e}"
 
 
+# Mock weather data, preformatted per city
+_WEATHER_CONDITIONS = MappingProxyType({
+    city: f"{data['temp']}°F, {data['condition']}, {data['humidity']}% humidity"
+    for city, data in {
+        "san francisco": {"temp": 62, "condition": "Foggy", "humidity": 78},
+        "new york": {"temp": 45, "condition": "Cloudy", "humidity": 65},
+        "los angeles": {"temp": 75, "condition": "Sunny", "humidity": 40},
+        "chicago": {"temp": 38, "condition": "Windy", "humidity": 55},
+        "miami": {"temp": 82, "condition": "Sunny", "humidity": 70},
+    }.items()
+})
+_DEFAULT_WEATHER_CONDITIONS = "55°F, Partly Cloudy, 50% humidity (default)"
+
+
 @tool
 def get_weather(location: str) -> str:
     """Get the current weather for a location.
@@ -129,21 +234,8 @@ def get_weather(location: str) -> str:
     Returns:
         Weather information for the location
     """
-    # Mock weather data
-    weather_data = {
-        "san francisco": {"temp": 62, "condition": "Foggy", "humidity": 78},
-        "new york": {"temp": 45, "condition": "Cloudy", "humidity": 65},
-        "los angeles": {"temp": 75, "condition": "Sunny", "humidity": 40},
-        "chicago": {"temp": 38, "condition": "Windy", "humidity": 55},
-        "miami": {"temp": 82, "condition": "Sunny", "humidity": 70},
-    }
-
-    location_lower = location.lower()
-    if location_lower in weather_data:
-        data = weather_data[location_lower]
-        return f"Weather in {location}: {data['temp']}°F, {data['condition']}, {data['humidity']}% humidity"
-    else:
-        return f"Weather in {location}: 55°F, Partly Cloudy, 50% humidity (default)"
+    conditions = _WEATHER_CONDITIONS.get(location.lower(), _DEFAULT_WEATHER_CONDITIONS)
+    return f"Weather in {location}: {conditions}"
 
 
 @tool
@@ -172,6 +264,90 @@ Note: This is mock search data for demonstration purposes."""
 TOOLS = [calculator, get_weather, web_search]
 TOOL_MAP = {tool.name: tool for tool in TOOLS}
 
+# Tool schemas in OpenAI function-calling format, generated once; every
+# provider's bind_tools accepts this format directly
+TOOL_SCHEMAS = [convert_to_openai_tool(t) for t in TOOLS]
+
+# Worker threads for running a turn's tool calls in parallel
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent-tool")
+
+
+def build_waves(tool_calls: list[dict]) -> list[list[int]]:
+    """Group a turn's tool calls into waves that can run concurrently.
+
+    A call whose arguments mention another call's id depends on that call
+    and is placed in a later wave.
+
+    Args:
+        tool_calls: Tool calls from the LLM's last message
+
+    Returns:
+        Waves of indexes into tool_calls, in dependency order
+    """
+    ids = {call["id"]: index for index, call in enumerate(tool_calls) if call.get("id")}
+    dependencies: list[set[int]] = [set() for _ in tool_calls]
+
+    if len(ids) > 1:
+        # Longest first, so an id is not matched as a prefix of a longer one
+        by_length = sorted(ids, key=len, reverse=True)
+        id_pattern = re.compile("|".join(map(re.escape, by_length)))
+        for index, call in enumerate(tool_calls):
+            args = json.dumps(call["args"], default=str)
+            dependencies[index].update(ids[m] for m in id_pattern.findall(args))
+            dependencies[index].discard(index)
+
+    # Kahn's algorithm, one wave per level
+    dependents: list[list[int]] = [[] for _ in tool_calls]
+    for index, producers in enumerate(dependencies):
+        for producer in producers:
+            dependents[producer].append(index)
+    remaining = [len(producers) for producers in dependencies]
+
+    waves = []
+    wave = [index for index, count in enumerate(remaining) if count == 0]
+    while wave:
+        waves.append(wave)
+        next_wave = []
+        for producer in wave:
+            for index in dependents[producer]:
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    next_wave.append(index)
+        wave = sorted(next_wave)
+
+    # Calls caught in a reference cycle run last, in their original order
+    cyclic = [index for index, count in enumerate(remaining) if count > 0]
+    if cyclic:
+        waves.append(cyclic)
+
+    return waves
+
+
+def _run_tool(tool_call: dict) -> ToolMessage:
+    """Execute a single tool call inside its own tool span."""
+    tool_name = tool_call["name"]
+    tool_args = tool_call["args"]
+
+    logger.info("  Calling tool: %s(%s)", tool_name, tool_args)
+
+    with tracer.tool(
+        name=f"tool-{tool_name}",
+        tool_name=tool_name,
+        tool_input=json.dumps(tool_args),
+    ) as span:
+        # Execute the tool
+        tool_fn = TOOL_MAP.get(tool_name)
+        if tool_fn:
+            result = tool_fn.invoke(tool_args)
+        else:
+            result = f"Unknown tool: {tool_name}"
+
+        span.attributes["tool.output"] = truncate(result, 500)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("  Tool result: %s...", truncate(result, 100))
+
+    return ToolMessage(content=str(result), tool_call_id=tool_call["id"])
+
 
 # =============================================================================
 # Agent State
@@ -183,6 +359,10 @@ class AgentState(TypedDict):
 
     messages: Annotated[list, add_messages]
     tool_calls_made: int
+    # Running token count of messages[:counted_messages], so each model call
+    # only counts the messages appended since the previous one
+    input_tokens: int
+    counted_messages: int
 
 
 # =============================================================================
@@ -190,9 +370,13 @@ class AgentState(TypedDict):
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=8)
 def create_agent(model_name: str = "gemini-2.5-flash"):
     """Create the agent with the specified model.
 
+    The compiled graph holds no per-query state, so it is built once per model
+    and reused by later queries.
+
     Supported models (2025):
         - Vertex AI: gemini-2.5-flash (default), gemini-2.0-flash
         - Vertex AI Claude: claude-sonnet-4-5@20250514, claude-opus-4-5@20250514
@@ -201,7 +385,7 @@ def create_agent(model_name: str = "gemini-2.5-flash"):
     """
     # Initialize LLM with tools
     llm = get_llm(model_name)
-    llm_with_tools = llm.bind_tools(TOOLS)
+    llm_with_tools = llm.bind_tools(TOOL_SCHEMAS)
 
     def call_model(state: AgentState) -> AgentState:
         """Call the LLM to decide next action."""
@@ -209,7 +393,7 @@ def create_agent(model_name: str = "gemini-2.5-flash"):
 
         # Format messages for logging
         last_message = messages[-1] if messages else None
-        input_preview = str(last_message.content)[:200] if last_message else ""
+        input_preview = truncate(last_message.content, 200) if last_message else ""
 
         with tracer.generation(
             name="llm-call",
@@ -219,12 +403,17 @@ def create_agent(model_name: str = "gemini-2.5-flash"):
             response = llm_with_tools.invoke(messages)
 
             # Update span with output
-            output_preview = str(response.content)[:200] if response.content else ""
+            output_preview = truncate(response.content, 200)
             span.attributes["gen_ai.completion"] = output_preview
 
-            # Estimate tokens (rough)
-            input_tokens = sum(len(str(m.content)) // 4 for m in messages)
-            output_tokens = len(str(response.content)) // 4 if response.content else 10
+            # Count tokens, adding only messages appended since the last call
+            counted = state.get("counted_messages", 0)
+            input_tokens = state.get("input_tokens", 0) + sum(
+                count_tokens(str(m.content)) for m in messages[counted:]
+            )
+            output_tokens = (
+                count_tokens(str(response.content)) if response.content else 10
+            )
             span.attributes["gen_ai.usage.input_tokens"] = input_tokens
             span.attributes["gen_ai.usage.output_tokens"] = output_tokens
             span.attributes["gen_ai.usage.total_tokens"] = input_tokens + output_tokens
@@ -232,39 +421,39 @@ def create_agent(model_name: str = "gemini-2.5-flash"):
             if response.tool_calls:
                 span.attributes["tool_calls"] = len(response.tool_calls)
 
-        print(f"  LLM response: {response.content[:100] if response.content else '[tool calls]'}...")
+        if logger.isEnabledFor(logging.INFO):
+            preview = (
+                truncate(response.content, 100) if response.content else "[tool calls]"
+            )
+            logger.info("  LLM response: %s...", preview)
 
-        return {"messages": [response], "tool_calls_made": state.get("tool_calls_made", 0)}
+        return {
+            "messages": [response],
+            "tool_calls_made": state.get("tool_calls_made", 0),
+            "input_tokens": input_tokens,
+            "counted_messages": len(messages),
+        }
 
     def call_tools(state: AgentState) -> AgentState:
         """Execute tool calls from the last message."""
-        last_message = state["messages"][-1]
-        tool_messages = []
-
-        for tool_call in last_message.tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
-
-            print(f"  Calling tool: {tool_name}({tool_args})")
-
-            with tracer.tool(
-                name=f"tool-{tool_name}",
-                tool_name=tool_name,
-                tool_input=json.dumps(tool_args),
-            ) as span:
-                # Execute the tool
-                tool_fn = TOOL_MAP.get(tool_name)
-                if tool_fn:
-                    result = tool_fn.invoke(tool_args)
-                else:
-                    result = f"Unknown tool: {tool_name}"
-
-                span.attributes["tool.output"] = str(result)[:500]
-                print(f"  Tool result: {result[:100]}...")
-
-            tool_messages.append(
-                ToolMessage(content=str(result), tool_call_id=tool_call["id"])
-            )
+        tool_calls = state["messages"][-1].tool_calls
+        tool_messages: list[ToolMessage | None] = [None] * len(tool_calls)
+
+        # Calls within a wave are independent and run concurrently; each task
+        # gets its own copy of the context so its span is parented correctly
+        for wave in build_waves(tool_calls):
+            if len(wave) == 1:
+                tool_messages[wave[0]] = _run_tool(tool_calls[wave[0]])
+                continue
+
+            futures = {
+                index: _TOOL_EXECUTOR.submit(
+                    contextvars.copy_context().run, _run_tool, tool_calls[index]
+                )
+                for index in wave
+            }
+            for index, future in futures.items():
+                tool_messages[index] = future.result()
 
         return {
             "messages": tool_messages,
@@ -330,6 +519,8 @@ def run_agent(query: str, model: str = "gpt-4o-mini") -> str:
         result = agent.invoke({
             "messages": [HumanMessage(content=query)],
             "tool_calls_made": 0,
+            "input_tokens": 0,
+            "counted_messages": 0,
         })
 
         # Extract final response
@@ -4,21 +4,102 @@ Neon Tracer
 A lightweight tracer that sends spans to Neon's API in OTLP format.
 """
 
+import atexit
+import json
+import logging
 import os
+import queue
+import threading
 import time
-import uuid
+from collections.abc import Callable
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 
+logger = logging.getLogger("neon.tracer")
+
 # Configuration
 NEON_API_URL = os.getenv("NEON_API_URL", "http://localhost:3000")
 NEON_PROJECT_ID = os.getenv("NEON_PROJECT_ID", "00000000-0000-0000-0000-000000000001")
 
+# Background flush: send up to this many spans per request, waiting at most
+# this long (seconds) for a batch to fill
+FLUSH_BATCH_SIZE = 512
+FLUSH_INTERVAL = 0.25
+# Longest flush() waits for queued spans to be sent, e.g. at exit
+FLUSH_TIMEOUT = 10.0
+
+# Active trace and innermost open span, tracked per thread/task so concurrent
+# traces and tool calls each parent their spans correctly
+_current_trace_id: ContextVar[str | None] = ContextVar(
+    "neon_current_trace_id", default=None
+)
+_current_span_id: ContextVar[str | None] = ContextVar(
+    "neon_current_span_id", default=None
+)
+
+# OTLP attribute values by exact type; subclasses go through _encode_attribute
+_ATTRIBUTE_ENCODERS: dict[type, Callable[[Any], dict]] = {
+    str: lambda value: {"stringValue": value},
+    bool: lambda value: {"boolValue": value},
+    int: lambda value: {"intValue": str(value)},
+    float: lambda value: {"doubleValue": value},
+}
+
+
+def _encode_attribute(value: Any) -> dict:
+    """Encode an attribute value of any type as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    elif isinstance(value, int):
+        return {"intValue": str(value)}
+    elif isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+# Optional fast JSON encoding for OTLP requests; falls back to the stdlib
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def truncate(value: Any, limit: int) -> str:
+    """Return at most limit characters of value's text.
+
+    Strings are sliced directly. LangChain content-block lists are walked
+    only until limit characters of text have been collected, so large
+    responses are never stringified in full.
+    """
+    if isinstance(value, str):
+        return value[:limit]
+
+    if isinstance(value, list):
+        parts = []
+        remaining = limit
+        for block in value:
+            if remaining <= 0:
+                break
+            if isinstance(block, dict):
+                text = block.get("text", "")
+            else:
+                text = block if isinstance(block, str) else str(block)
+            parts.append(text[:remaining])
+            remaining -= len(parts[-1])
+        return "".join(parts)
+
+    return str(value)[:limit]
 
-@dataclass
+
+@dataclass(slots=True, kw_only=True)
 class Span:
     """A span representing a unit of work."""
 
@@ -34,16 +115,11 @@ class Span:
 
     def to_otlp(self) -> dict:
         """Convert to OTLP span format."""
-        attrs = []
-        for key, value in self.attributes.items():
-            if isinstance(value, bool):
-                attrs.append({"key": key, "value": {"boolValue": value}})
-            elif isinstance(value, int):
-                attrs.append({"key": key, "value": {"intValue": str(value)}})
-            elif isinstance(value, float):
-                attrs.append({"key": key, "value": {"doubleValue": value}})
-            else:
-                attrs.append({"key": key, "value": {"stringValue": str(value)}})
+        encoders = _ATTRIBUTE_ENCODERS
+        attrs = [
+            {"key": key, "value": encoders.get(type(value), _encode_attribute)(value)}
+            for key, value in self.attributes.items()
+        ]
 
         span_dict = {
             "traceId": self.trace_id,
@@ -73,36 +149,139 @@ class NeonTracer:
     ):
         self.api_url = api_url
         self.project_id = project_id
-        self.spans: list[Span] = []
-        self.current_trace_id: str | None = None
-        self.current_span_id: str | None = None
+
+        # Finished spans wait here for the background flush thread
+        self._queue: queue.Queue[Span] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        atexit.register(self.flush)
+
+        # Parts of every OTLP request that do not change between flushes
+        self._otlp_resource = {
+            "attributes": [
+                {"key": "service.name", "value": {"stringValue": "langgraph-agent"}},
+                {"key": "project.id", "value": {"stringValue": project_id}},
+            ]
+        }
+        self._otlp_scope = {"name": "neon-tracer", "version": "0.1.0"}
+        self._traces_url = f"{api_url}/api/v1/traces"
+        self._headers = {
+            "Content-Type": "application/json",
+            "x-project-id": project_id,
+        }
+
+        # One pooled client, so keep-alive connections are reused across traces
+        self._client = httpx.Client(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    def close(self) -> None:
+        """Send any queued spans and close the tracer's HTTP connections."""
+        self.flush()
+        self._client.close()
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """Wait up to timeout seconds for every finished span to be sent.
+
+        Returns False if spans were still queued when the wait ended.
+        """
+        worker = self._worker
+        if worker is None:
+            return True
+
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not worker.is_alive():
+                    logger.warning(
+                        "Gave up waiting for %d queued spans",
+                        self._queue.unfinished_tasks,
+                    )
+                    return False
+                self._queue.all_tasks_done.wait(min(remaining, FLUSH_INTERVAL))
+        return True
+
+    def _enqueue(self, span: Span) -> None:
+        """Queue a finished span, starting the flush thread if it is not running."""
+        if self._worker is None or not self._worker.is_alive():
+            with self._worker_lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(
+                        target=self._flush_loop, name="neon-tracer-flush", daemon=True
+                    )
+                    self._worker.start()
+        self._queue.put(span)
+
+    def _flush_loop(self) -> None:
+        """Send queued spans in batches of up to FLUSH_BATCH_SIZE."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < FLUSH_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            try:
+                self._send_spans(batch)
+            except Exception:
+                # Keep the thread alive so later spans and flush() still work
+                logger.exception("Failed to send %d spans to Neon", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @property
+    def current_trace_id(self) -> str | None:
+        """ID of the active trace in the current context."""
+        return _current_trace_id.get()
+
+    @property
+    def current_span_id(self) -> str | None:
+        """ID of the innermost open span in the current context."""
+        return _current_span_id.get()
 
     def _generate_id(self) -> str:
-        """Generate a random ID (16 hex chars for span, 32 for trace)."""
-        return uuid.uuid4().hex[:16]
+        """Generate a random span ID (16 hex chars)."""
+        return os.urandom(8).hex()
+
+    def _generate_trace_id(self) -> str:
+        """Generate a random trace ID (32 hex chars)."""
+        return os.urandom(16).hex()
 
     def _now_ns(self) -> int:
         """Get current time in nanoseconds."""
-        return int(time.time() * 1e9)
+        return time.time_ns()
 
     @contextmanager
     def trace(self, name: str):
         """Start a new trace context."""
-        self.current_trace_id = uuid.uuid4().hex
-        self.current_span_id = None
-        self.spans = []
-
-        print(f"\n{'='*60}")
-        print(f"Starting trace: {name}")
-        print(f"Trace ID: {self.current_trace_id}")
-        print(f"{'='*60}\n")
+        trace_id = self._generate_trace_id()
+        trace_token = _current_trace_id.set(trace_id)
+        span_token = _current_span_id.set(None)
+
+        banner = "=" * 60
+        logger.info(
+            "\n%s\nStarting trace: %s\nTrace ID: %s\n%s\n",
+            banner,
+            name,
+            trace_id,
+            banner,
+        )
 
         try:
             yield self
         finally:
-            # Send all collected spans
-            self._send_spans()
-            self.current_trace_id = None
+            # Spans are sent in the background as they finish
+            logger.info("\nTrace queued for Neon: %s/traces/%s", self.api_url, trace_id)
+            _current_span_id.reset(span_token)
+            _current_trace_id.reset(trace_token)
 
     @contextmanager
     def span(
@@ -112,14 +291,16 @@ class NeonTracer:
         attributes: dict[str, Any] | None = None,
     ):
         """Create a span within the current trace."""
-        if not self.current_trace_id:
+        trace_id = _current_trace_id.get()
+        if not trace_id:
             raise RuntimeError("No active trace. Use tracer.trace() first.")
 
         span_id = self._generate_id()
-        parent_span_id = self.current_span_id
+        parent_span_id = _current_span_id.get()
 
+        start_mono_ns = time.monotonic_ns()
         span = Span(
-            trace_id=self.current_trace_id,
+            trace_id=trace_id,
             span_id=span_id,
             name=name,
             start_time_ns=self._now_ns(),
@@ -134,8 +315,7 @@ class NeonTracer:
             span.attributes["tool.call.id"] = span_id
 
         # Push this span as current
-        previous_span_id = self.current_span_id
-        self.current_span_id = span_id
+        span_token = _current_span_id.set(span_id)
 
         try:
             yield span
@@ -145,9 +325,12 @@ class NeonTracer:
             span.status_message = str(e)
             raise
         finally:
-            span.end_time_ns = self._now_ns()
-            self.spans.append(span)
-            self.current_span_id = previous_span_id
+            # Duration comes from the monotonic clock, so it is never skewed
+            # by wall-clock adjustments during the span
+            elapsed_ns = time.monotonic_ns() - start_mono_ns
+            span.end_time_ns = span.start_time_ns + elapsed_ns
+            self._enqueue(span)
+            _current_span_id.reset(span_token)
 
     def generation(
         self,
@@ -190,26 +373,17 @@ class NeonTracer:
             },
         )
 
-    def _send_spans(self):
-        """Send collected spans to Neon API."""
-        if not self.spans:
-            print("No spans to send.")
-            return
-
-        # Build OTLP request
+    def _send_spans(self, spans: list[Span]) -> None:
+        """Send a batch of finished spans to Neon API."""
+        # Build OTLP request around the static resource and scope
         otlp_request = {
             "resourceSpans": [
                 {
-                    "resource": {
-                        "attributes": [
-                            {"key": "service.name", "value": {"stringValue": "langgraph-agent"}},
-                            {"key": "project.id", "value": {"stringValue": self.project_id}},
-                        ]
-                    },
+                    "resource": self._otlp_resource,
                     "scopeSpans": [
                         {
-                            "scope": {"name": "neon-tracer", "version": "0.1.0"},
-                            "spans": [span.to_otlp() for span in self.spans],
+                            "scope": self._otlp_scope,
+                            "spans": [span.to_otlp() for span in spans],
                         }
                     ],
                 }
@@ -217,23 +391,26 @@ class NeonTracer:
         }
 
         # Send to Neon
-        url = f"{self.api_url}/api/v1/traces"
-        headers = {
-            "Content-Type": "application/json",
-            "x-project-id": self.project_id,
-        }
-
         try:
-            response = httpx.post(url, json=otlp_request, headers=headers, timeout=10.0)
+            response = self._client.post(
+                self._traces_url,
+                content=_json_dumps(otlp_request),
+                headers=self._headers,
+            )
             response.raise_for_status()
             result = response.json()
-            print(f"\nSent {len(self.spans)} spans to Neon")
-            print(f"  Traces: {result.get('traces', 0)}")
-            print(f"  Spans: {result.get('spans', 0)}")
-            print(f"  View at: {self.api_url}/traces/{self.current_trace_id}")
-        except httpx.HTTPError as e:
-            print(f"\nFailed to send spans to Neon: {e}")
-            print("Make sure the Neon frontend is running (bun dev in frontend/)")
+            logger.info(
+                "\nSent %d spans to Neon\n  Traces: %s\n  Spans: %s",
+                len(spans),
+                result.get("traces", 0),
+                result.get("spans", 0),
+            )
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(
+                "\nFailed to send spans to Neon: %s\n"
+                "Make sure the Neon frontend is running (bun dev in frontend/)",
+                e,
+            )
 
 
 # Global tracer instance
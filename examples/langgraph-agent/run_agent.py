@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 
 from dotenv import load_dotenv
@@ -41,6 +42,10 @@ def main():
 
     args = parser.parse_args()
 
+    # Agent and tracer progress is logged; show it like regular output
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("neon").setLevel(logging.INFO)
+
     # Import here to avoid import errors before env vars are loaded
     from agent import run_agent
 
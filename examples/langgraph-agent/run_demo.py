@@ -11,12 +11,15 @@ Usage:
     python run_demo.py --model gpt-4o     # Use a specific model
     python run_demo.py --count 3          # Run only first 3 queries
     python run_demo.py --delay 5          # Wait 5s between queries
+    python run_demo.py --concurrency 4    # Run up to 4 queries at once
 """
 
 import argparse
+import logging
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
@@ -39,37 +42,49 @@ DEMO_QUERIES = [
 ]
 
 
-def wait_for_api(api_url: str, max_retries: int = 30, delay: float = 2.0) -> bool:
-    """Wait for the Neon API to be available."""
+def wait_for_api(
+    api_url: str,
+    max_retries: int = 12,
+    initial_delay: float = 0.25,
+    max_delay: float = 8.0,
+) -> bool:
+    """Wait for the Neon API to be available.
+
+    Each attempt tries the health endpoint, then the traces endpoint for
+    deployments without one, over one pooled connection. The delay between
+    attempts doubles up to max_delay (about a minute in total by default).
+    """
     import httpx
 
     print(f"Waiting for Neon API at {api_url}...")
-    for i in range(max_retries):
-        try:
-            response = httpx.get(f"{api_url}/api/health", timeout=5.0)
-            if response.status_code < 500:
-                print(f"  API is ready! (attempt {i + 1})")
-                return True
-        except httpx.HTTPError:
-            pass
-
-        # Also try the traces endpoint as a fallback
-        try:
-            response = httpx.post(
-                f"{api_url}/api/v1/traces",
-                json={"resourceSpans": []},
-                headers={"Content-Type": "application/json"},
-                timeout=5.0,
-            )
-            if response.status_code < 500:
-                print(f"  API is ready! (attempt {i + 1})")
-                return True
-        except httpx.HTTPError:
-            pass
-
-        if i < max_retries - 1:
-            print(f"  Not ready yet (attempt {i + 1}/{max_retries}), retrying in {delay}s...")
-            time.sleep(delay)
+    with httpx.Client(timeout=5.0) as client:
+        delay = initial_delay
+        for i in range(max_retries):
+            try:
+                response = client.get(f"{api_url}/api/health")
+                if response.status_code < 500:
+                    print(f"  API is ready! (attempt {i + 1})")
+                    return True
+            except httpx.HTTPError:
+                pass
+
+            # Also try the traces endpoint as a fallback
+            try:
+                response = client.post(
+                    f"{api_url}/api/v1/traces",
+                    json={"resourceSpans": []},
+                    headers={"Content-Type": "application/json"},
+                )
+                if response.status_code < 500:
+                    print(f"  API is ready! (attempt {i + 1})")
+                    return True
+            except httpx.HTTPError:
+                pass
+
+            if i < max_retries - 1:
+                print(f"  Not ready yet (attempt {i + 1}/{max_retries}), retrying in {delay}s...")
+                time.sleep(delay)
+                delay = min(delay * 2, max_delay)
 
     print("  API did not become ready in time!")
     return False
@@ -81,8 +96,18 @@ def main():
     parser.add_argument("--count", type=int, default=0, help="Number of queries (0=all)")
     parser.add_argument("--delay", type=float, default=2.0, help="Delay between queries (seconds)")
     parser.add_argument("--no-wait", action="store_true", help="Don't wait for API")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Queries to run at once (1=sequential with --delay between them)",
+    )
     args = parser.parse_args()
 
+    # Agent and tracer progress is logged; show it like regular output
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("neon").setLevel(logging.INFO)
+
     api_url = os.getenv("NEON_API_URL", "http://localhost:3000")
 
     # Wait for the API to be available
@@ -103,16 +128,24 @@ def main():
     print(f"  Dashboard: {api_url}/traces")
     print(f"{'=' * 60}\n")
 
-    for i, query in enumerate(queries, 1):
+    def run_query(i: int, query: str) -> None:
         print(f"\n--- Query {i}/{len(queries)} ---")
         try:
             run_agent(query, model=args.model)
         except Exception as e:
             print(f"  Error: {e}")
 
-        if i < len(queries):
-            print(f"\n  (waiting {args.delay}s before next query...)")
-            time.sleep(args.delay)
+    if args.concurrency > 1:
+        # Queries are independent; each runs its own trace in a worker thread
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(run_query, range(1, len(queries) + 1), queries))
+    else:
+        for i, query in enumerate(queries, 1):
+            run_query(i, query)
+
+            if i < len(queries):
+                print(f"\n  (waiting {args.delay}s before next query...)")
+                time.sleep(args.delay)
 
     print(f"\n{'=' * 60}")
     print(f"  Demo complete! View traces at:")
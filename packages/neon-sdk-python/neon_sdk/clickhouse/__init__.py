@@ -9,8 +9,10 @@ Requires the `clickhouse` optional dependency:
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime
+from operator import attrgetter
 from typing import Any
 
 try:
@@ -127,6 +129,42 @@ class ScoreRecord:
     timestamp: datetime
 
 
+# Record fields map one-to-one onto table columns, in table order. Inserts
+# are sent column-oriented: one list per column, read with a getter that is
+# bound once here rather than building a dict per row.
+_TRACE_COLUMNS = tuple(f.name for f in fields(TraceRecord))
+_SPAN_COLUMNS = tuple(f.name for f in fields(SpanRecord))
+_SCORE_COLUMNS = tuple(f.name for f in fields(ScoreRecord))
+
+_TRACE_GETTERS = tuple(map(attrgetter, _TRACE_COLUMNS))
+_SPAN_GETTERS = tuple(map(attrgetter, _SPAN_COLUMNS))
+_SCORE_GETTERS = tuple(map(attrgetter, _SCORE_COLUMNS))
+
+
+# Deduplication keys and the tables' ORDER BY, used to pre-merge batches.
+_TRACE_KEY = attrgetter("project_id", "trace_id")
+_TRACE_ORDER = attrgetter("project_id", "timestamp", "trace_id")
+_SPAN_KEY = attrgetter("project_id", "trace_id", "span_id")
+_SPAN_ORDER = attrgetter("project_id", "trace_id", "timestamp", "span_id")
+
+
+def _merge_sorted(
+    records: Sequence[Any],
+    key: Callable[[Any], Any],
+    order: Callable[[Any], Any],
+) -> list[Any]:
+    """Keep the last record for each key, sorted by the table's ORDER BY."""
+    latest = {key(record): record for record in records}
+    return sorted(latest.values(), key=order)
+
+
+def _to_columns(
+    records: Sequence[Any], getters: tuple[Callable[[Any], Any], ...]
+) -> list[list[Any]]:
+    """Transpose records into one list of values per column."""
+    return [list(map(getter, records)) for getter in getters]
+
+
 # =============================================================================
 # Dashboard Types
 # =============================================================================
@@ -241,90 +279,55 @@ class NeonClickHouseClient:
 
     # ==================== Insert Operations ====================
 
-    def insert_traces(self, traces: list[TraceRecord]) -> None:
-        """Insert traces into ClickHouse."""
+    def insert_traces(self, traces: list[TraceRecord], presort: bool = False) -> None:
+        """Insert traces into ClickHouse.
+
+        Args:
+            traces: Trace records to insert
+            presort: Keep only the last record per (project_id, trace_id) and
+                sort by the table's ORDER BY before sending. The table does not
+                deduplicate, so this changes what is stored: earlier updates in
+                the batch are dropped.
+        """
         client = self._get_client()
-        data = [
-            {
-                "project_id": t.project_id,
-                "trace_id": t.trace_id,
-                "name": t.name,
-                "timestamp": t.timestamp,
-                "end_time": t.end_time,
-                "duration_ms": t.duration_ms,
-                "status": t.status,
-                "metadata": t.metadata,
-                "agent_id": t.agent_id,
-                "agent_version": t.agent_version,
-                "workflow_id": t.workflow_id,
-                "run_id": t.run_id,
-                "total_tokens": t.total_tokens,
-                "total_cost": t.total_cost,
-                "llm_calls": t.llm_calls,
-                "tool_calls": t.tool_calls,
-            }
-            for t in traces
-        ]
-        client.insert("traces", data)
+        if presort:
+            traces = _merge_sorted(traces, _TRACE_KEY, _TRACE_ORDER)
+        client.insert(
+            "traces",
+            _to_columns(traces, _TRACE_GETTERS),
+            column_names=_TRACE_COLUMNS,
+            column_oriented=True,
+        )
 
-    def insert_spans(self, spans: list[SpanRecord]) -> None:
-        """Insert spans into ClickHouse."""
+    def insert_spans(self, spans: list[SpanRecord], presort: bool = False) -> None:
+        """Insert spans into ClickHouse.
+
+        Args:
+            spans: Span records to insert
+            presort: Keep only the last record per (project_id, trace_id,
+                span_id) and sort by the table's ORDER BY before sending. The
+                table does not deduplicate, so this changes what is stored:
+                earlier updates in the batch are dropped.
+        """
         client = self._get_client()
-        data = [
-            {
-                "project_id": s.project_id,
-                "trace_id": s.trace_id,
-                "span_id": s.span_id,
-                "parent_span_id": s.parent_span_id,
-                "name": s.name,
-                "kind": s.kind,
-                "span_type": s.span_type,
-                "timestamp": s.timestamp,
-                "end_time": s.end_time,
-                "duration_ms": s.duration_ms,
-                "status": s.status,
-                "status_message": s.status_message,
-                "model": s.model,
-                "model_parameters": s.model_parameters,
-                "input": s.input,
-                "output": s.output,
-                "input_tokens": s.input_tokens,
-                "output_tokens": s.output_tokens,
-                "total_tokens": s.total_tokens,
-                "cost_usd": s.cost_usd,
-                "tool_name": s.tool_name,
-                "tool_input": s.tool_input,
-                "tool_output": s.tool_output,
-                "attributes": s.attributes,
-            }
-            for s in spans
-        ]
-        client.insert("spans", data)
+        if presort:
+            spans = _merge_sorted(spans, _SPAN_KEY, _SPAN_ORDER)
+        client.insert(
+            "spans",
+            _to_columns(spans, _SPAN_GETTERS),
+            column_names=_SPAN_COLUMNS,
+            column_oriented=True,
+        )
 
     def insert_scores(self, scores: list[ScoreRecord]) -> None:
         """Insert scores into ClickHouse."""
         client = self._get_client()
-        data = [
-            {
-                "project_id": s.project_id,
-                "score_id": s.score_id,
-                "trace_id": s.trace_id,
-                "span_id": s.span_id,
-                "run_id": s.run_id,
-                "case_id": s.case_id,
-                "name": s.name,
-                "value": s.value,
-                "score_type": s.score_type,
-                "string_value": s.string_value,
-                "comment": s.comment,
-                "source": s.source,
-                "config_id": s.config_id,
-                "author_id": s.author_id,
-                "timestamp": s.timestamp,
-            }
-            for s in scores
-        ]
-        client.insert("scores", data)
+        client.insert(
+            "scores",
+            _to_columns(scores, _SCORE_GETTERS),
+            column_names=_SCORE_COLUMNS,
+            column_oriented=True,
+        )
 
     # ==================== Query Operations ====================
 
@@ -0,0 +1,146 @@
+"""Tests for ClickHouse client inserts."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from neon_sdk.clickhouse import (
+    ClickHouseConfig,
+    NeonClickHouseClient,
+    ScoreRecord,
+    SpanRecord,
+    TraceRecord,
+)
+
+
+def make_trace(trace_id: str, second: int, name: str = "trace") -> TraceRecord:
+    return TraceRecord(
+        project_id="proj-1",
+        trace_id=trace_id,
+        name=name,
+        timestamp=datetime(2024, 1, 1, 0, 0, second),
+        end_time=None,
+        duration_ms=0,
+        status="ok",
+        metadata={},
+    )
+
+
+def make_span(trace_id: str, span_id: str, second: int, status: str = "ok") -> SpanRecord:
+    return SpanRecord(
+        project_id="proj-1",
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_span_id=None,
+        name="span",
+        kind="internal",
+        span_type="span",
+        timestamp=datetime(2024, 1, 1, 0, 0, second),
+        end_time=None,
+        duration_ms=0,
+        status=status,
+    )
+
+
+def make_client() -> tuple[NeonClickHouseClient, MagicMock]:
+    client = NeonClickHouseClient(ClickHouseConfig())
+    driver = MagicMock()
+    client._client = driver
+    return client, driver
+
+
+class TestInserts:
+    """Tests for insert_traces, insert_spans and insert_scores."""
+
+    def test_insert_traces_sends_columns(self) -> None:
+        client, driver = make_client()
+
+        client.insert_traces([make_trace("t-1", 2, "first"), make_trace("t-2", 1, "second")])
+
+        (table, data), kwargs = driver.insert.call_args
+        columns = dict(zip(kwargs["column_names"], data))
+        assert table == "traces"
+        assert kwargs["column_oriented"] is True
+        assert len(data) == len(kwargs["column_names"])
+        assert columns["trace_id"] == ["t-1", "t-2"]
+        assert columns["name"] == ["first", "second"]
+        assert columns["total_tokens"] == [0, 0]
+
+    def test_insert_traces_keeps_all_rows_by_default(self) -> None:
+        client, driver = make_client()
+
+        client.insert_traces([make_trace("t-1", 1), make_trace("t-1", 2)])
+
+        (_, data), kwargs = driver.insert.call_args
+        columns = dict(zip(kwargs["column_names"], data))
+        assert columns["trace_id"] == ["t-1", "t-1"]
+
+    def test_insert_traces_presort_keeps_last_and_sorts(self) -> None:
+        client, driver = make_client()
+
+        client.insert_traces(
+            [
+                make_trace("t-2", 5, "stale"),
+                make_trace("t-1", 3),
+                make_trace("t-2", 1, "latest"),
+            ],
+            presort=True,
+        )
+
+        (_, data), kwargs = driver.insert.call_args
+        columns = dict(zip(kwargs["column_names"], data))
+        # Ordered by (project_id, timestamp, trace_id); the later t-2 record wins
+        assert columns["trace_id"] == ["t-2", "t-1"]
+        assert columns["name"] == ["latest", "trace"]
+
+    def test_insert_spans_presort_keeps_last_and_sorts(self) -> None:
+        client, driver = make_client()
+
+        client.insert_spans(
+            [
+                make_span("t-2", "s-1", 1),
+                make_span("t-1", "s-2", 4, status="unset"),
+                make_span("t-1", "s-1", 3),
+                make_span("t-1", "s-2", 2, status="error"),
+            ],
+            presort=True,
+        )
+
+        (table, data), kwargs = driver.insert.call_args
+        columns = dict(zip(kwargs["column_names"], data))
+        # Ordered by (project_id, trace_id, timestamp, span_id)
+        assert table == "spans"
+        assert list(zip(columns["trace_id"], columns["span_id"])) == [
+            ("t-1", "s-2"),
+            ("t-1", "s-1"),
+            ("t-2", "s-1"),
+        ]
+        assert columns["status"] == ["error", "ok", "ok"]
+
+    def test_insert_scores_sends_columns(self) -> None:
+        client, driver = make_client()
+        score = ScoreRecord(
+            project_id="proj-1",
+            score_id="score-1",
+            trace_id="t-1",
+            span_id=None,
+            run_id=None,
+            case_id=None,
+            name="accuracy",
+            value=0.9,
+            score_type="numeric",
+            string_value=None,
+            comment="",
+            source="sdk",
+            config_id=None,
+            author_id=None,
+            timestamp=datetime(2024, 1, 1),
+        )
+
+        client.insert_scores([score])
+
+        (table, data), kwargs = driver.insert.call_args
+        columns = dict(zip(kwargs["column_names"], data))
+        assert table == "scores"
+        assert kwargs["column_oriented"] is True
+        assert columns["score_id"] == ["score-1"]
+        assert columns["value"] == [0.9]